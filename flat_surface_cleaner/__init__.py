@@ -0,0 +1,72 @@
+bl_info = {
+    "name": "Flat Surface Cleaner",
+    "author": "ChatGPT",
+    "version": (1, 1, 0),
+    "blender": (3, 6, 0),
+    "location": "View3D > Sidebar (N) > Mesh > Flat Surface Cleaner",
+    "description": "Torna a seleção totalmente plana e reconstrói como uma única face (sem geometria interna extra).",
+    "category": "Mesh",
+}
+
+# No registro só entram UI, propriedades e o handler do índice de topologia.
+# `geometry` e `tolerance` (e o NumPy) são importados na primeira execução de
+# um operador ou quando um script acessa a API por este pacote.
+import importlib
+
+import bpy
+
+from . import operators, panel, props, topology
+
+# API para scripts, resolvida sob demanda (PEP 562)
+_LAZY_API = {
+    "PlanarFaceResult": "geometry",
+    "PlanarFaceAnalysis": "geometry",
+    "make_planar_single_face": "geometry",
+    "make_planar_single_face_regions": "geometry",
+    "analyze_planar_single_face": "geometry",
+    "analyze_planar_single_face_regions": "geometry",
+    "estimate_tolerances": "tolerance",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_API.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_API))
+
+
+# ============================================================
+# Registro
+# ============================================================
+classes = (
+    props.FSC_AddonPreferences,
+    props.FSC_Settings,
+    operators.FSC_OT_make_planar_single_face,
+    operators.FSC_OT_analyze_planar_single_face,
+    panel.FSC_PT_panel,
+)
+
+
+def register():
+    for c in classes:
+        bpy.utils.register_class(c)
+    bpy.types.Scene.fsc_settings = bpy.props.PointerProperty(type=props.FSC_Settings)
+    bpy.app.handlers.depsgraph_update_post.append(topology.depsgraph_update_post)
+
+
+def unregister():
+    if topology.depsgraph_update_post in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(topology.depsgraph_update_post)
+    topology.TOPOLOGY_INDEX.clear()
+    if hasattr(bpy.types.Scene, "fsc_settings"):
+        del bpy.types.Scene.fsc_settings
+    for c in reversed(classes):
+        bpy.utils.unregister_class(c)
+
@@ -0,0 +1,1115 @@
+"""Geometria do add-on: plano de ajuste, contorno e reconstrução em 1 face.
+
+Módulo pesado: importado só na primeira execução de um operador (ou quando
+um script acessa a API pelo pacote).
+"""
+
+import bmesh
+import math
+from mathutils import Vector, Matrix
+from mathutils.kdtree import KDTree
+
+
+# ============================================================
+# Matemática: plano de melhor ajuste (sem numpy)
+# ============================================================
+def _deg_to_rad(d: float) -> float:
+    return d * math.pi / 180.0
+
+
+def _solve_3x3(A: Matrix, b: Vector) -> Vector:
+    """Resolve A x = b por eliminação de Gauss (A 3x3)."""
+    m = [[A[0][0], A[0][1], A[0][2], b[0]],
+         [A[1][0], A[1][1], A[1][2], b[1]],
+         [A[2][0], A[2][1], A[2][2], b[2]]]
+
+    # pivoteamento parcial
+    for i in range(3):
+        pivot = i
+        maxv = abs(m[i][i])
+        for r in range(i + 1, 3):
+            v = abs(m[r][i])
+            if v > maxv:
+                maxv = v
+                pivot = r
+        if maxv < 1e-14:
+            raise ZeroDivisionError("Matriz singular/quase singular.")
+        if pivot != i:
+            m[i], m[pivot] = m[pivot], m[i]
+
+        # elimina abaixo
+        piv = m[i][i]
+        for r in range(i + 1, 3):
+            f = m[r][i] / piv
+            m[r][i] = 0.0
+            m[r][1] -= f * m[i][1]
+            m[r][2] -= f * m[i][2]
+            m[r][3] -= f * m[i][3]
+
+    # retro-substituição
+    x = [0.0, 0.0, 0.0]
+    for i in (2, 1, 0):
+        s = m[i][3]
+        for j in range(i + 1, 3):
+            s -= m[i][j] * x[j]
+        x[i] = s / m[i][i]
+    return Vector((x[0], x[1], x[2]))
+
+
+def _best_fit_plane(verts):
+    """Retorna (normal, ponto_no_plano) via covariância + inverse iteration."""
+    pts = [v.co.copy() for v in verts]
+    if len(pts) < 3:
+        return Vector((0.0, 0.0, 1.0)), pts[0] if pts else Vector((0.0, 0.0, 0.0))
+
+    c = Vector((0.0, 0.0, 0.0))
+    for p in pts:
+        c += p
+    c /= len(pts)
+
+    xx = xy = xz = yy = yz = zz = 0.0
+    for p in pts:
+        r = p - c
+        xx += r.x * r.x
+        xy += r.x * r.y
+        xz += r.x * r.z
+        yy += r.y * r.y
+        yz += r.y * r.z
+        zz += r.z * r.z
+
+    C = Matrix(((xx, xy, xz),
+                (xy, yy, yz),
+                (xz, yz, zz)))
+
+    eps = 1e-12 * (xx + yy + zz + 1.0)
+    A = C + Matrix.Identity(3) * eps
+
+    x = Vector((1.0, 0.3, 0.2)).normalized()
+    for _ in range(24):
+        try:
+            y = _solve_3x3(A, x)
+        except ZeroDivisionError:
+            # fallback simples
+            return Vector((0.0, 0.0, 1.0)), c
+        if y.length < 1e-14:
+            break
+        x = y.normalized()
+
+    n = x.normalized()
+    if n.length < 1e-12:
+        n = Vector((0.0, 0.0, 1.0))
+    return n, c
+
+
+def _average_face_normal(faces):
+    n = Vector((0.0, 0.0, 0.0))
+    for f in faces:
+        try:
+            n += f.normal * f.calc_area()
+        except Exception:
+            n += f.normal
+    if n.length < 1e-12:
+        return Vector((0.0, 0.0, 1.0))
+    return n.normalized()
+
+
+def _make_plane_basis(n: Vector):
+    """Cria base ortonormal (u,v) no plano."""
+    u = n.orthogonal()
+    if u.length < 1e-12:
+        u = Vector((1.0, 0.0, 0.0))
+    u.normalize()
+    v = n.cross(u)
+    if v.length < 1e-12:
+        v = Vector((0.0, 1.0, 0.0))
+    v.normalize()
+    return u, v
+
+
+def _poly_area_2d(loop_verts, origin, u, v):
+    """Área assinada (módulo) do polígono projetado no plano."""
+    return _poly_area_2d_coords([bv.co for bv in loop_verts], origin, u, v)
+
+
+def _poly_area_2d_coords(coords, origin, u, v):
+    """Como `_poly_area_2d`, mas a partir de coordenadas (sem BMVert)."""
+    if len(coords) < 3:
+        return 0.0
+    pts2 = []
+    for co in coords:
+        p = co - origin
+        pts2.append((p.dot(u), p.dot(v)))
+    area = 0.0
+    for i in range(len(pts2)):
+        x1, y1 = pts2[i]
+        x2, y2 = pts2[(i + 1) % len(pts2)]
+        area += x1 * y2 - x2 * y1
+    return abs(area) * 0.5
+
+
+# ============================================================
+# Topologia: boundary loop + rebuild em 1 face
+# ============================================================
+def _boundary_edges_of_selected_faces(sel_faces):
+    sel_set = set(sel_faces)
+    boundary = set()
+    for f in sel_faces:
+        for e in f.edges:
+            count = 0
+            for lf in e.link_faces:
+                if lf in sel_set:
+                    count += 1
+            if count == 1:
+                boundary.add(e)
+    return boundary
+
+
+def _edges_to_loops(edges):
+    """Extrai loops (cada loop = lista ordenada de BMVert) de um conjunto de arestas de contorno."""
+    edges = {e for e in edges if getattr(e, "is_valid", False)}
+    if not edges:
+        return []
+
+    # adjacência
+    adj = {}
+    for e in edges:
+        v1, v2 = e.verts[0], e.verts[1]
+        adj.setdefault(v1, []).append(v2)
+        adj.setdefault(v2, []).append(v1)
+
+    unused = set(edges)
+    loops = []
+
+    def _find_edge(a, b):
+        for ee in a.link_edges:
+            if ee in edges and ee in unused:
+                if (ee.verts[0] == b) or (ee.verts[1] == b):
+                    return ee
+        return None
+
+    while unused:
+        e0 = next(iter(unused))
+        v_start = e0.verts[0]
+        v_next = e0.verts[1]
+        loop = [v_start, v_next]
+        unused.discard(e0)
+
+        prev = v_start
+        curr = v_next
+
+        # segue até fechar ou travar
+        guard = 0
+        while guard < 200000:
+            guard += 1
+            neigh = adj.get(curr, [])
+            if len(neigh) < 1:
+                break
+            # tenta escolher o próximo diferente do anterior
+            if len(neigh) == 1:
+                cand = neigh[0]
+            else:
+                cand = neigh[0] if neigh[0] != prev else neigh[1]
+
+            if cand == v_start:
+                # fechou
+                break
+
+            ee = _find_edge(curr, cand)
+            if ee is None:
+                # pode ser que a aresta exista mas já foi consumida; tenta outro vizinho
+                if len(neigh) > 2:
+                    found = False
+                    for alt in neigh:
+                        if alt == prev or alt == v_start:
+                            continue
+                        ee2 = _find_edge(curr, alt)
+                        if ee2:
+                            cand = alt
+                            ee = ee2
+                            found = True
+                            break
+                    if not found:
+                        break
+                else:
+                    break
+
+            loop.append(cand)
+            unused.discard(ee)
+            prev, curr = curr, cand
+
+        # valida loop fechado (último conecta no primeiro)
+        if len(loop) >= 3 and (loop[-1] in adj.get(v_start, [])):
+            loops.append(loop)
+
+    return loops
+
+
+def _boundary_is_manifold(edges):
+    """Retorna True se cada vértice de contorno se conecta a exatamente duas arestas."""
+    counts = {}
+    for e in edges:
+        for v in e.verts:
+            counts[v] = counts.get(v, 0) + 1
+    if not counts:
+        return False
+    return all(c == 2 for c in counts.values())
+
+
+def _project_verts_to_plane(verts, origin: Vector, normal: Vector):
+    n = normal.normalized()
+    for v in verts:
+        try:
+            if not v.is_valid:
+                continue
+        except ReferenceError:
+            continue
+        d = (v.co - origin).dot(n)
+        v.co -= n * d
+
+
+def _dissolve_collinear_boundary(bm, loop_verts, angle_tol_rad: float):
+    """Remove vértices colineares no contorno (reduz vertices 'inúteis' sem alterar forma)."""
+    if angle_tol_rad <= 0.0:
+        return
+    if len(loop_verts) < 4:
+        return
+
+    to_dissolve = []
+    n = len(loop_verts)
+    for i in range(n):
+        v_prev = loop_verts[(i - 1) % n]
+        v = loop_verts[i]
+        v_next = loop_verts[(i + 1) % n]
+        if not (v_prev.is_valid and v.is_valid and v_next.is_valid):
+            continue
+
+        a = (v_prev.co - v.co)
+        b = (v_next.co - v.co)
+        if a.length < 1e-12 or b.length < 1e-12:
+            continue
+        ang = a.angle(b)
+        # colinear se ~ 180 graus
+        if abs(math.pi - ang) <= angle_tol_rad:
+            to_dissolve.append(v)
+
+    if to_dissolve:
+        try:
+            bmesh.ops.dissolve_verts(bm, verts=to_dissolve)
+        except Exception:
+            pass
+
+
+def _resolve_faces(bm, faces):
+    """Converte índices/BMFace em lista de BMFace válidas, sem repetição."""
+    out = []
+    seen = set()
+    lookup_ready = False
+    for f in faces:
+        if isinstance(f, int):
+            if not lookup_ready:
+                bm.faces.ensure_lookup_table()
+                lookup_ready = True
+            f = bm.faces[f]
+        if f.is_valid and f not in seen:
+            seen.add(f)
+            out.append(f)
+    return out
+
+
+def _marked_faces_around(verts):
+    """Faces marcadas (select) ligadas aos vértices dados (busca local, sem varrer a malha)."""
+    faces = set()
+    for v in verts:
+        if not v.is_valid:
+            continue
+        for f in v.link_faces:
+            if f.select:
+                faces.add(f)
+    return faces
+
+
+def _face_tags(bm, f):
+    """Atributos inteiros da face (material e camadas int, p.ex. face sets)."""
+    return f.material_index, [(layer, f[layer]) for layer in bm.faces.layers.int.values()]
+
+
+def _most_common(values):
+    """Valor mais frequente (empate: o menor), para resultado determinístico."""
+    counts = {}
+    for x in values:
+        counts[x] = counts.get(x, 0) + 1
+    return min(counts, key=lambda x: (-counts[x], x))
+
+
+def _region_tags(bm, sel_faces, active_face=None):
+    """Tags da face nova: as da face ativa, se estiver na região; senão as mais comuns."""
+    af = active_face if active_face is not None else bm.faces.active
+    if af is not None and af.is_valid and af in set(sel_faces):
+        return _face_tags(bm, af)
+    material_index = _most_common(f.material_index for f in sel_faces)
+    ints = [(layer, _most_common(f[layer] for f in sel_faces)) for layer in bm.faces.layers.int.values()]
+    return material_index, ints
+
+
+def _apply_face_tags(f, tags):
+    material_index, ints = tags
+    f.material_index = material_index
+    for layer, value in ints:
+        f[layer] = value
+
+
+def _region_diagonal(coords) -> float:
+    """Diagonal da caixa envolvente das coordenadas."""
+    lo = Vector((math.inf, math.inf, math.inf))
+    hi = -lo
+    for co in coords:
+        lo = Vector(map(min, lo, co))
+        hi = Vector(map(max, hi, co))
+    if lo.x > hi.x:
+        return 0.0
+    return (hi - lo).length
+
+
+def object_diagonal(ob) -> float:
+    """Diagonal da bound box local do objeto (mesmo espaço das coordenadas da BMesh)."""
+    return _region_diagonal(Vector(c) for c in ob.bound_box)
+
+
+def _region_plane(bm, sel_faces, sel_verts, plane_mode, active_face=None):
+    """Retorna (normal, origem) do plano final, ou None se a face ativa for inválida."""
+    if plane_mode == "ACTIVE":
+        af = active_face if active_face is not None else bm.faces.active
+        if af is None or not af.is_valid or af not in set(sel_faces):
+            return None
+        return af.normal.normalized(), af.calc_center_median()
+    if plane_mode == "AVERAGE":
+        normal = _average_face_normal(sel_faces)
+        origin = sum((v.co for v in sel_verts), Vector((0.0, 0.0, 0.0))) / len(sel_verts)
+        return normal, origin
+    return _best_fit_plane(sel_verts)
+
+
+# ============================================================
+# API para scripts: BMesh -> 1 face plana (sem bpy.ops)
+# ============================================================
+class PlanarFaceResult:
+    """Resultado de `make_planar_single_face`.
+
+    Em caso de falha `ok` é False e `reason` traz o código do erro (a chave
+    `report_*` correspondente, sem o prefixo). `modified` é True assim que a
+    geometria foi alterada, inclusive quando a falha vem depois disso.
+    """
+
+    __slots__ = (
+        "ok",
+        "reason",
+        "modified",
+        "face",
+        "normal",
+        "origin",
+        "loop_count",
+        "boundary_verts",
+        "faces_removed",
+        "verts_removed",
+        "verts_welded",
+        "verts_dissolved",
+        "merge_distance",
+        "simplify_angle",
+    )
+
+    def __init__(self):
+        self.ok = False
+        self.reason = ""
+        self.modified = False
+        self.face = None
+        self.normal = None
+        self.origin = None
+        self.loop_count = 0
+        self.boundary_verts = 0
+        self.faces_removed = 0
+        self.verts_removed = 0
+        self.verts_welded = 0
+        self.verts_dissolved = 0
+        self.merge_distance = 0.0
+        self.simplify_angle = 0.0
+
+    @property
+    def face_index(self) -> int:
+        """Índice da face final (-1 se não houver).
+
+        Faces novas só têm índice confiável após `bm.faces.index_update()`;
+        em lotes, chame-o uma única vez no fim.
+        """
+        if self.face is None or not self.face.is_valid:
+            return -1
+        return self.face.index
+
+    def _fail(self, reason: str):
+        self.ok = False
+        self.reason = reason
+        return self
+
+    def __repr__(self):
+        if not self.ok:
+            return f"PlanarFaceResult(ok=False, reason={self.reason!r}, modified={self.modified})"
+        return (
+            f"PlanarFaceResult(ok=True, loops={self.loop_count}, "
+            f"boundary_verts={self.boundary_verts}, faces_removed={self.faces_removed})"
+        )
+
+
+def make_planar_single_face(
+    bm,
+    faces,
+    *,
+    plane_mode: str = "BEST_FIT",
+    active_face=None,
+    remove_doubles: bool = True,
+    merge_distance: float = 0.0001,
+    simplify_boundary: bool = False,
+    simplify_angle: float = 0.2,
+    keep_largest_loop: bool = True,
+    recalc_normals: bool = True,
+    auto_tolerance: bool = False,
+    scale: float = 0.0,
+    boundary_edges=None,
+) -> PlanarFaceResult:
+    """Planariza a região `faces` de `bm` e a reconstrói como uma única face.
+
+    Não depende de contexto, modo de edição nem de `bpy.ops`: funciona em
+    malhas de `bmesh.from_edit_mesh` e de `bmesh.new()`. `faces` aceita
+    índices ou BMFace; `simplify_angle` é em graus. Não chama
+    `bmesh.update_edit_mesh` nem `bm.normal_update()`, então scripts podem
+    processar várias regiões e gravar a malha uma única vez.
+
+    A flag `select` das faces serve de marcador da região (sobrevive ao weld):
+    as faces da região são marcadas e as vizinhas desmarcadas durante a
+    operação; ao final as vizinhas voltam a ser marcadas e a face nova fica
+    selecionada.
+
+    Com `auto_tolerance`, `merge_distance` e `simplify_angle` são estimados
+    pelo contorno da região (ver `tolerance.estimate_tolerances`); `scale` é a
+    diagonal do objeto (0 = usa a da região). Os valores usados ficam no
+    resultado.
+
+    `boundary_edges` permite reaproveitar o contorno já conhecido da região
+    (p.ex. de um índice em cache) em vez de recalculá-lo.
+
+    Em caso de falha, `modified` indica se a malha já tinha sido alterada
+    (projeção, weld, remoções) antes dela; sem undo, o script decide se
+    descarta a BMesh.
+    """
+    res = PlanarFaceResult()
+
+    sel_faces = _resolve_faces(bm, faces)
+    if not sel_faces:
+        return res._fail("select_faces")
+
+    sel_verts = {v for f in sel_faces for v in f.verts}
+    if len(sel_verts) < 3:
+        return res._fail("minimum_selection")
+
+    # Material/face set da região (face ativa ou os mais comuns) passam para a face nova
+    tags = _region_tags(bm, sel_faces, active_face)
+
+    # Marca a região; vizinhas desmarcadas para não contaminar as buscas locais
+    sel_set = set(sel_faces)
+    for f in sel_faces:
+        f.select = True
+    unmarked = [f for f in _marked_faces_around(sel_verts) if f not in sel_set]
+    for f in unmarked:
+        f.select = False
+
+    try:
+        return _rebuild_marked_region(
+            bm, res, sel_faces, sel_verts, tags,
+            plane_mode=plane_mode,
+            active_face=active_face,
+            remove_doubles=remove_doubles,
+            merge_distance=merge_distance,
+            simplify_boundary=simplify_boundary,
+            simplify_angle=simplify_angle,
+            keep_largest_loop=keep_largest_loop,
+            recalc_normals=recalc_normals,
+            auto_tolerance=auto_tolerance,
+            scale=scale,
+            boundary_edges=boundary_edges,
+        )
+    finally:
+        # devolve a seleção das vizinhas que o chamador não passou
+        for f in unmarked:
+            if f.is_valid:
+                f.select = True
+
+
+def _rebuild_marked_region(
+    bm,
+    res,
+    sel_faces,
+    sel_verts,
+    tags,
+    *,
+    plane_mode,
+    active_face,
+    remove_doubles,
+    merge_distance,
+    simplify_boundary,
+    simplify_angle,
+    keep_largest_loop,
+    recalc_normals,
+    auto_tolerance,
+    scale,
+    boundary_edges,
+):
+    """Corpo de `make_planar_single_face`, com a região já marcada por `select`."""
+    if boundary_edges is None:
+        boundary_edges = _boundary_edges_of_selected_faces(sel_faces)
+    else:
+        boundary_edges = {e for e in boundary_edges if e.is_valid}
+    if not boundary_edges:
+        # seleção sem contorno => superfície fechada/total; não dá para virar 'um tampo' só
+        if len(sel_faces) == 1:
+            # já é uma face: só planariza
+            n, p0 = _best_fit_plane(sel_verts)
+            res.modified = True
+            _project_verts_to_plane(sel_verts, p0, n)
+            face = sel_faces[0]
+            face.normal_update()
+            res.ok = True
+            res.face = face
+            res.normal, res.origin = n, p0
+            res.loop_count = 1
+            res.boundary_verts = len(face.verts)
+            return res
+        return res._fail("no_boundary")
+
+    # Define o plano final
+    plane = _region_plane(bm, sel_faces, sel_verts, plane_mode, active_face)
+    if plane is None:
+        return res._fail("invalid_active")
+    normal, origin = plane
+    res.normal, res.origin = normal, origin
+
+    # Planariza TUDO na seleção (inclui contorno) de forma exata
+    res.modified = True
+    _project_verts_to_plane(sel_verts, origin, normal)
+
+    if auto_tolerance:
+        from .tolerance import estimate_tolerances
+
+        merge_distance, simplify_angle = estimate_tolerances(
+            boundary_edges, lambda bv: bv.co, scale or _region_diagonal(v.co for v in sel_verts))
+    res.merge_distance, res.simplify_angle = merge_distance, simplify_angle
+
+    # Opcional: weld (apenas para reduzir duplicados no contorno antes do rebuild)
+    if remove_doubles and merge_distance > 0.0:
+        try:
+            bmesh.ops.remove_doubles(bm, verts=list(sel_verts), dist=merge_distance)
+        except Exception:
+            pass
+        survivors = {v for v in sel_verts if v.is_valid}
+        res.verts_welded = len(sel_verts) - len(survivors)
+        sel_verts = survivors
+
+    # Recalcula boundary após weld
+    sel_faces = _marked_faces_around(sel_verts)
+    if not sel_faces:
+        return res._fail("invalid_selection")
+
+    sel_verts = {v for f in sel_faces for v in f.verts}
+    boundary_edges = _boundary_edges_of_selected_faces(sel_faces)
+    if not _boundary_is_manifold(boundary_edges):
+        return res._fail("non_manifold_boundary")
+    loops = _edges_to_loops(boundary_edges)
+    if not loops:
+        return res._fail("invalid_loop")
+    res.loop_count = len(loops)
+
+    # Escolhe loop (maior área no plano) se solicitado
+    if keep_largest_loop and len(loops) > 1:
+        u, v = _make_plane_basis(normal)
+        loops_sorted = sorted(loops, key=lambda lp: _poly_area_2d(lp, origin, u, v), reverse=True)
+        loop = loops_sorted[0]
+        # descarta geometria de loops menores (preenche furos)
+        keep_edges = set()
+        loop_set = set(loop)
+        for e in boundary_edges:
+            a, b = e.verts[0], e.verts[1]
+            if a in loop_set and b in loop_set:
+                keep_edges.add(e)
+        # remove quaisquer arestas/verts do contorno não pertencentes ao loop principal
+        trash_edges = [e for e in boundary_edges if e not in keep_edges and getattr(e, "is_valid", False)]
+        if trash_edges:
+            try:
+                bmesh.ops.delete(bm, geom=trash_edges, context='EDGES')
+            except Exception:
+                pass
+    else:
+        loop = loops[0]
+
+    # Simplifica contorno (opcional)
+    if simplify_boundary and simplify_angle > 0.0:
+        loop_len = len(loop)
+        _dissolve_collinear_boundary(bm, loop, _deg_to_rad(simplify_angle))
+        # re-extraí loop do contorno atual (para garantir consistência)
+        boundary_edges = _boundary_edges_of_selected_faces(list(_marked_faces_around(sel_verts)))
+        if not _boundary_is_manifold(boundary_edges):
+            return res._fail("non_manifold_boundary")
+        loops2 = _edges_to_loops(boundary_edges)
+        if loops2:
+            if keep_largest_loop and len(loops2) > 1:
+                u, v = _make_plane_basis(normal)
+                loops2 = sorted(loops2, key=lambda lp: _poly_area_2d(lp, origin, u, v), reverse=True)
+            loop = loops2[0]
+        res.verts_dissolved = max(0, loop_len - len(loop))
+
+    # Remove todas as faces da região (mantendo contorno)
+    # (remoção manual evita apagar contorno por contexto errado)
+    for f in _marked_faces_around(sel_verts):
+        try:
+            bm.faces.remove(f)
+            res.faces_removed += 1
+        except Exception:
+            pass
+
+    # Remove toda geometria interna restante (tudo que estava na seleção e não é do contorno)
+    loop_set = set([v for v in loop if getattr(v, "is_valid", False)])
+    internal_verts = [v for v in sel_verts if getattr(v, "is_valid", False) and v not in loop_set]
+    if internal_verts:
+        res.verts_removed = len(internal_verts)
+        try:
+            bmesh.ops.delete(bm, geom=internal_verts, context='VERTS')
+        except Exception:
+            # fallback: remove manual
+            for vv in internal_verts:
+                try:
+                    bm.verts.remove(vv)
+                except Exception:
+                    pass
+
+    # Garante que o loop ainda é válido e fechado
+    # (operação final deve usar o loop em ordem)
+    loop = [v for v in loop if getattr(v, "is_valid", False)]
+    if len(loop) < 3:
+        return res._fail("invalid_loop_after_cleanup")
+
+    # Cria UMA face (ngon) com o contorno
+    new_face = None
+    try:
+        new_face = bm.faces.new(loop)
+    except ValueError:
+        # Já existe uma face com esse ciclo (ou loop repetido). Tenta achar face existente.
+        loop_vs = set(loop)
+        for f in loop[0].link_faces:
+            vs = set(f.verts)
+            if len(vs) == len(loop) and vs == loop_vs:
+                new_face = f
+                break
+    except Exception:
+        new_face = None
+
+    if new_face is None:
+        return res._fail("create_face_fail")
+
+    _apply_face_tags(new_face, tags)
+    new_face.select = True
+    new_face.normal_update()
+    if recalc_normals:
+        try:
+            bmesh.ops.recalc_face_normals(bm, faces=[new_face])
+        except Exception:
+            pass
+
+    res.ok = True
+    res.face = new_face
+    res.boundary_verts = len(loop)
+    return res
+
+
+# Atributo inteiro usado por cada modo regional
+_FACE_SET_LAYER = ".sculpt_face_set"
+
+
+def region_key_getter(bm, region_source):
+    """Função face -> chave inteira do modo regional (None se o atributo não existir)."""
+    if region_source == "MATERIAL":
+        return lambda f: f.material_index
+    if region_source == "FACE_SET":
+        layer = bm.faces.layers.int.get(_FACE_SET_LAYER)
+        if layer is None:
+            return None
+        return lambda f: f[layer]
+    raise ValueError(f"region_source desconhecido: {region_source!r}")
+
+
+def _tagged_regions(faces, key_of):
+    """Agrupa as faces pela chave numa passada e separa cada grupo em componentes conexas."""
+    groups = {}
+    for f in faces:
+        groups.setdefault(key_of(f), set()).add(f)
+
+    regions = []
+    for key, remaining in groups.items():
+        while remaining:
+            seed = remaining.pop()
+            comp = [seed]
+            stack = [seed]
+            while stack:
+                f = stack.pop()
+                for e in f.edges:
+                    for lf in e.link_faces:
+                        if lf in remaining:
+                            remaining.discard(lf)
+                            comp.append(lf)
+                            stack.append(lf)
+            regions.append((key, comp))
+    return regions
+
+
+def _regrow_region(valid, key, key_of, done):
+    """Reconstitui uma região cujas faces foram recriadas pelo weld de uma região vizinha."""
+    comp = set(valid)
+    stack = list(valid)
+    while stack:
+        f = stack.pop()
+        for e in f.edges:
+            for lf in e.link_faces:
+                if lf not in comp and lf not in done and key_of(lf) == key:
+                    comp.add(lf)
+                    stack.append(lf)
+    return list(comp)
+
+
+def _relocate_face(verts):
+    """Face que contém todos os vértices ainda válidos de `verts` (recriada pelo weld), ou None."""
+    alive = [v for v in verts if v.is_valid]
+    if len(alive) < 3:
+        return None
+    candidates = set(alive[0].link_faces)
+    for v in alive[1:]:
+        candidates.intersection_update(v.link_faces)
+        if not candidates:
+            return None
+    return min(candidates, key=lambda f: len(f.verts))
+
+
+def make_planar_single_face_regions(bm, faces, *, region_source: str = "MATERIAL", **options):
+    """Reconstrói cada região de `faces` (agrupadas por material ou face set) como uma face.
+
+    Cada componente conexa de faces com a mesma chave é uma região e passa por
+    `make_planar_single_face` com as mesmas `options`. Com `plane_mode="ACTIVE"`,
+    regiões que não contêm a face ativa usam o melhor ajuste. Como as demais
+    funções da API, não grava a malha. Retorna a lista de `PlanarFaceResult`,
+    uma por região.
+
+    O weld de uma região pode recriar a face nova de uma região vizinha já
+    reconstruída; o resultado dela passa a apontar para a face recriada ou,
+    se ela não for encontrada, vira falha `region_lost`.
+    """
+    key_of = region_key_getter(bm, region_source)
+    if key_of is None:
+        raise ValueError(f"A malha não possui o atributo {_FACE_SET_LAYER!r}.")
+
+    active = bm.faces.active
+    plane_mode = options.pop("plane_mode", "BEST_FIT")
+    done = set()
+    loops = {}  # resultado ok -> vértices da face nova (para relocalizá-la)
+    results = []
+    for key, comp in _tagged_regions(_resolve_faces(bm, faces), key_of):
+        valid = [f for f in comp if f.is_valid]
+        if len(valid) < len(comp) and valid:
+            valid = _regrow_region(valid, key, key_of, done)
+        if not valid:
+            results.append(PlanarFaceResult()._fail("invalid_selection"))
+            continue
+
+        mode = plane_mode
+        if mode == "ACTIVE" and active not in valid:
+            mode = "BEST_FIT"
+        res = make_planar_single_face(bm, valid, plane_mode=mode, active_face=active, **options)
+        if res.ok:
+            done.add(res.face)
+            loops[res] = list(res.face.verts)
+        results.append(res)
+
+        if res.modified:
+            for prev, loop_verts in list(loops.items()):
+                if prev.face.is_valid:
+                    continue
+                done.discard(prev.face)
+                face = _relocate_face(loop_verts)
+                if face is None:
+                    del loops[prev]
+                    prev.face = None
+                    prev._fail("region_lost")
+                else:
+                    prev.face = face
+                    loops[prev] = list(face.verts)
+                    done.add(face)
+    return results
+
+
+# ============================================================
+# Análise sem alterar a malha (dry-run)
+# ============================================================
+class PlanarFaceAnalysis:
+    """Previsão de `make_planar_single_face` calculada sem modificar a BMesh.
+
+    `ok`/`reason` seguem `PlanarFaceResult`: `ok` False indica que a execução
+    real deve falhar pelo motivo `reason`.
+    """
+
+    __slots__ = (
+        "ok",
+        "reason",
+        "normal",
+        "origin",
+        "max_deviation",
+        "rms_deviation",
+        "loop_count",
+        "loop_areas",
+        "boundary_verts",
+        "verts_welded",
+        "verts_dissolved",
+        "faces_removed",
+        "verts_removed",
+        "final_vert_count",
+        "merge_distance",
+        "simplify_angle",
+    )
+
+    def __init__(self):
+        self.ok = False
+        self.reason = ""
+        self.normal = None
+        self.origin = None
+        self.max_deviation = 0.0
+        self.rms_deviation = 0.0
+        self.loop_count = 0
+        self.loop_areas = []
+        self.boundary_verts = 0
+        self.verts_welded = 0
+        self.verts_dissolved = 0
+        self.faces_removed = 0
+        self.verts_removed = 0
+        self.final_vert_count = 0
+        self.merge_distance = 0.0
+        self.simplify_angle = 0.0
+
+    def _fail(self, reason: str):
+        self.ok = False
+        self.reason = reason
+        return self
+
+    def __repr__(self):
+        if not self.ok:
+            return f"PlanarFaceAnalysis(ok=False, reason={self.reason!r})"
+        return (
+            f"PlanarFaceAnalysis(ok=True, loops={self.loop_count}, "
+            f"max_deviation={self.max_deviation:.6g}, final_vert_count={self.final_vert_count})"
+        )
+
+
+def _predict_weld(verts, coords, dist: float):
+    """Agrupa vértices a menos de `dist` (como remove_doubles). Retorna vert -> representante."""
+    verts = list(verts)
+    rep = {}
+    if dist <= 0.0 or len(verts) < 2:
+        for v in verts:
+            rep[v] = v
+        return rep
+    tree = KDTree(len(verts))
+    for i, v in enumerate(verts):
+        tree.insert(coords[v], i)
+    tree.balance()
+    for v in verts:
+        if v in rep:
+            continue
+        rep[v] = v
+        for _co, i, _d in tree.find_range(coords[v], dist):
+            other = verts[i]
+            if other not in rep:
+                rep[other] = v
+    return rep
+
+
+def _pair_loops(pairs):
+    """Loops ordenados de um grafo de contorno em que todo vértice tem grau 2."""
+    adj = {}
+    for a, b in pairs:
+        adj.setdefault(a, []).append(b)
+        adj.setdefault(b, []).append(a)
+    seen = set()
+    loops = []
+    for start in adj:
+        if start in seen:
+            continue
+        loop = [start]
+        seen.add(start)
+        prev, curr = None, start
+        while True:
+            neigh = adj[curr]
+            nxt = neigh[0] if neigh[0] is not prev else neigh[1]
+            if nxt is start or nxt in seen:
+                break
+            loop.append(nxt)
+            seen.add(nxt)
+            prev, curr = curr, nxt
+        if len(loop) >= 3:
+            loops.append(loop)
+    return loops
+
+
+def _count_collinear(coords_loop, angle_tol_rad: float) -> int:
+    """Quantos vértices `_dissolve_collinear_boundary` removeria do loop."""
+    n = len(coords_loop)
+    if angle_tol_rad <= 0.0 or n < 4:
+        return 0
+    count = 0
+    for i in range(n):
+        a = coords_loop[(i - 1) % n] - coords_loop[i]
+        b = coords_loop[(i + 1) % n] - coords_loop[i]
+        if a.length < 1e-12 or b.length < 1e-12:
+            continue
+        if abs(math.pi - a.angle(b)) <= angle_tol_rad:
+            count += 1
+    return count
+
+
+def analyze_planar_single_face(
+    bm,
+    faces,
+    *,
+    plane_mode: str = "BEST_FIT",
+    active_face=None,
+    remove_doubles: bool = True,
+    merge_distance: float = 0.0001,
+    simplify_boundary: bool = False,
+    simplify_angle: float = 0.2,
+    keep_largest_loop: bool = True,
+    auto_tolerance: bool = False,
+    scale: float = 0.0,
+) -> PlanarFaceAnalysis:
+    """Prevê o resultado de `make_planar_single_face` sem tocar na BMesh.
+
+    Recebe as mesmas opções e trabalha sobre cópias projetadas das
+    coordenadas: desvio ao plano, loops e áreas, problemas de manifold,
+    vértices soldados/dissolvidos e contagem final de vértices. Custo
+    O(região), sem varrer a malha nem alterar flags de seleção.
+    """
+    res = PlanarFaceAnalysis()
+
+    sel_faces = _resolve_faces(bm, faces)
+    if not sel_faces:
+        return res._fail("select_faces")
+
+    sel_verts = {v for f in sel_faces for v in f.verts}
+    if len(sel_verts) < 3:
+        return res._fail("minimum_selection")
+
+    boundary_edges = _boundary_edges_of_selected_faces(sel_faces)
+    if not boundary_edges:
+        if len(sel_faces) == 1:
+            n, p0 = _best_fit_plane(sel_verts)
+            devs = [abs((v.co - p0).dot(n)) for v in sel_verts]
+            res.ok = True
+            res.normal, res.origin = n, p0
+            res.max_deviation = max(devs)
+            res.rms_deviation = math.sqrt(sum(d * d for d in devs) / len(devs))
+            res.loop_count = 1
+            res.boundary_verts = res.final_vert_count = len(sel_faces[0].verts)
+            return res
+        return res._fail("no_boundary")
+
+    plane = _region_plane(bm, sel_faces, sel_verts, plane_mode, active_face)
+    if plane is None:
+        return res._fail("invalid_active")
+    normal, origin = plane
+    normal = normal.normalized()
+    res.normal, res.origin = normal, origin
+
+    # Coordenadas projetadas (cópias) e desvio ao plano
+    coords = {}
+    sq = 0.0
+    for v in sel_verts:
+        d = (v.co - origin).dot(normal)
+        coords[v] = v.co - normal * d
+        res.max_deviation = max(res.max_deviation, abs(d))
+        sq += d * d
+    res.rms_deviation = math.sqrt(sq / len(sel_verts))
+
+    if auto_tolerance:
+        from .tolerance import estimate_tolerances
+
+        merge_distance, simplify_angle = estimate_tolerances(
+            boundary_edges, coords.__getitem__, scale or _region_diagonal(coords.values()))
+    res.merge_distance, res.simplify_angle = merge_distance, simplify_angle
+
+    # Weld previsto: arestas de contorno reescritas nos representantes
+    rep = _predict_weld(sel_verts, coords, merge_distance if remove_doubles else 0.0)
+    res.verts_welded = sum(1 for v, r in rep.items() if v is not r)
+
+    pair_count = {}
+    for e in boundary_edges:
+        a, b = rep[e.verts[0]], rep[e.verts[1]]
+        if a is b:
+            continue
+        key = (a, b) if id(a) < id(b) else (b, a)
+        pair_count[key] = pair_count.get(key, 0) + 1
+    # duas arestas de contorno fundidas numa só viram costura interna
+    pairs = [p for p, c in pair_count.items() if c == 1]
+
+    degree = {}
+    for a, b in pairs:
+        degree[a] = degree.get(a, 0) + 1
+        degree[b] = degree.get(b, 0) + 1
+    if not degree or any(c != 2 for c in degree.values()):
+        return res._fail("non_manifold_boundary")
+
+    loops = _pair_loops(pairs)
+    if not loops:
+        return res._fail("invalid_loop")
+    res.loop_count = len(loops)
+
+    u, v = _make_plane_basis(normal)
+    areas = [_poly_area_2d_coords([coords[bv] for bv in lp], origin, u, v) for lp in loops]
+    order = sorted(range(len(loops)), key=lambda i: areas[i], reverse=True)
+    res.loop_areas = [areas[i] for i in order]
+    loop = loops[order[0]] if keep_largest_loop and len(loops) > 1 else loops[0]
+    res.boundary_verts = len(loop)
+
+    if simplify_boundary and simplify_angle > 0.0:
+        res.verts_dissolved = _count_collinear([coords[bv] for bv in loop], _deg_to_rad(simplify_angle))
+
+    res.final_vert_count = len(loop) - res.verts_dissolved
+    if res.final_vert_count < 3:
+        return res._fail("invalid_loop_after_cleanup")
+
+    survivors = set(rep.values())
+    res.faces_removed = len(sel_faces)
+    res.verts_removed = len(survivors) - len(loop)
+    res.ok = True
+    return res
+
+
+def analyze_planar_single_face_regions(bm, faces, *, region_source: str = "MATERIAL", **options):
+    """Prevê `make_planar_single_face_regions`: uma `PlanarFaceAnalysis` por região.
+
+    Usa o mesmo agrupamento (componentes conexas com a mesma chave) e o mesmo
+    recuo de `plane_mode="ACTIVE"` para o melhor ajuste. Cada região é
+    analisada sobre a malha atual, sem o efeito do weld das regiões vizinhas
+    reconstruídas antes dela na execução real.
+    """
+    key_of = region_key_getter(bm, region_source)
+    if key_of is None:
+        raise ValueError(f"A malha não possui o atributo {_FACE_SET_LAYER!r}.")
+
+    active = bm.faces.active
+    plane_mode = options.pop("plane_mode", "BEST_FIT")
+    results = []
+    for _key, comp in _tagged_regions(_resolve_faces(bm, faces), key_of):
+        mode = plane_mode
+        if mode == "ACTIVE" and active not in comp:
+            mode = "BEST_FIT"
+        results.append(analyze_planar_single_face(bm, comp, plane_mode=mode, active_face=active, **options))
+    return results
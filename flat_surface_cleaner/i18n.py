@@ -0,0 +1,149 @@
+"""Localização simples (PT/EN) das labels e mensagens."""
+
+import bpy
+
+
+# ============================================================
+# Localização simples (PT/EN)
+# ============================================================
+DEFAULT_LANGUAGE = "PT"
+
+LOCALE_STRINGS = {
+    "PT": {
+        "prefs_language": "Idioma",
+        "prefs_language_desc": "Escolha o idioma das labels e mensagens do addon.",
+        "prefs_language_label": "Idioma do Add-on",
+        "prefs_language_prop": "Idioma",
+        "plane_mode": "Plano de Referência",
+        "plane_mode_desc": "Como definir o plano final",
+        "plane_best_fit": "Melhor Ajuste",
+        "plane_best_fit_desc": "Plano de melhor ajuste pelos vértices selecionados",
+        "plane_active": "Face Ativa",
+        "plane_active_desc": "Usa a normal/centro da face ativa (deve estar na seleção)",
+        "plane_average": "Média das Normais",
+        "plane_average_desc": "Média ponderada das normais das faces selecionadas",
+        "remove_doubles": "Weld no Contorno",
+        "remove_doubles_desc": "Mescla pontos muito próximos no contorno antes de criar a face",
+        "merge_distance": "Distância Weld",
+        "simplify_boundary": "Simplificar Contorno",
+        "simplify_boundary_desc": "Dissolve vértices colineares no contorno (reduz pontos 'extras' no perímetro)",
+        "simplify_angle": "Tolerância (°)",
+        "simplify_angle_desc": "Quanto mais alto, mais agressivo ao remover vértices colineares",
+        "auto_tolerance": "Tolerância Automática",
+        "auto_tolerance_desc": "Estima distância de weld e tolerância de simplificação pelo contorno da região, relativas à escala do objeto",
+        "keep_largest_loop": "Usar Apenas o Maior Contorno",
+        "keep_largest_loop_desc": "Se houver múltiplos contornos, mantém apenas o de maior área (preenche 'furos')",
+        "recalc_normals": "Recalcular Normais",
+        "region_source": "Regiões",
+        "region_source_desc": "Como separar a seleção em regiões a reconstruir",
+        "region_selection": "Seleção",
+        "region_selection_desc": "A seleção inteira vira uma única face",
+        "region_material": "Por Material",
+        "region_material_desc": "Cada grupo conectado de faces com o mesmo material vira uma face",
+        "region_face_set": "Por Face Set",
+        "region_face_set_desc": "Cada grupo conectado de faces com o mesmo face set vira uma face",
+        "panel_label": "Flat Surface Cleaner",
+        "section_plane": "Plano / Reconstrução:",
+        "section_contour": "Contorno:",
+        "operator_label": "Planarizar e Recriar como 1 Face",
+        "analyze_label": "Analisar (sem alterar)",
+        "analyze_desc": "Prevê o resultado da limpeza na seleção sem modificar a malha",
+        "report_analysis": "Previsão: {loops} contorno(s), desvio máx. {deviation:.6g}, weld {welded}, dissolve {dissolved}, face final com {verts} vértices.",
+        "report_analysis_fail": "Previsão de falha: {reason}",
+        "report_select_faces": "Selecione FACES (uma região de faces) antes de executar.",
+        "report_minimum_selection": "Seleção insuficiente (mínimo 3 vértices).",
+        "report_no_boundary": "Não foi encontrado contorno. A seleção parece não definir uma 'tampa' aberta.",
+        "report_invalid_active": "Face ativa inválida. Ative uma face dentro da seleção ou use 'Melhor Ajuste'.",
+        "report_invalid_selection": "A seleção ficou inválida após weld (sem faces).",
+        "report_region_lost": "A face reconstruída foi desfeita pelo weld de uma região vizinha.",
+        "report_non_manifold_boundary": "Contorno inválido: há vértice com menos de duas arestas ou com ramificações.",
+        "report_invalid_loop": "Contorno inválido (não foi possível formar loop fechado).",
+        "report_invalid_loop_after_cleanup": "Loop inválido após limpeza (contorno insuficiente).",
+        "report_create_face_fail": "Falha ao criar uma única face. Contorno pode estar auto-intersectando ou não-manifold.",
+        "report_no_face_sets": "A malha não possui face sets.",
+        "report_batch": "{ok} de {total} regiões reconstruídas.",
+        "report_region": "Região {index}/{total}: {text}",
+        "report_batch_analysis": "Previsão: {ok} de {total} regiões seriam reconstruídas.",
+        "report_auto_tolerance": "Tolerância automática: weld {merge:.6g}, simplificação {angle:.3g}°.",
+        "report_auto_tolerance_range": "Tolerância automática: weld {merge_min:.6g} a {merge_max:.6g}, simplificação {angle_min:.3g}° a {angle_max:.3g}°.",
+        "report_batch_failed": "{ok} de {total} regiões reconstruídas; {failed} falharam (primeira: {reason})",
+    },
+    "EN": {
+        "prefs_language": "Language",
+        "prefs_language_desc": "Choose the language for the add-on labels and messages.",
+        "prefs_language_label": "Add-on Language",
+        "prefs_language_prop": "Language",
+        "plane_mode": "Reference Plane",
+        "plane_mode_desc": "How to define the final plane",
+        "plane_best_fit": "Best Fit",
+        "plane_best_fit_desc": "Best-fit plane using the selected vertices",
+        "plane_active": "Active Face",
+        "plane_active_desc": "Use the active face normal/center (must be within the selection)",
+        "plane_average": "Average Normals",
+        "plane_average_desc": "Weighted average of the selected faces' normals",
+        "remove_doubles": "Boundary Weld",
+        "remove_doubles_desc": "Merge very close points on the boundary before creating the face",
+        "merge_distance": "Weld Distance",
+        "simplify_boundary": "Simplify Boundary",
+        "simplify_boundary_desc": "Dissolve collinear boundary vertices (removes extra perimeter points)",
+        "simplify_angle": "Tolerance (°)",
+        "simplify_angle_desc": "Higher values remove collinear vertices more aggressively",
+        "auto_tolerance": "Auto Tolerance",
+        "auto_tolerance_desc": "Estimate weld distance and simplify tolerance from the region boundary, relative to the object scale",
+        "keep_largest_loop": "Use Only Largest Boundary",
+        "keep_largest_loop_desc": "If multiple boundaries exist, keep only the one with the largest area (fills holes)",
+        "recalc_normals": "Recalculate Normals",
+        "region_source": "Regions",
+        "region_source_desc": "How to split the selection into regions to rebuild",
+        "region_selection": "Selection",
+        "region_selection_desc": "The whole selection becomes a single face",
+        "region_material": "By Material",
+        "region_material_desc": "Each connected group of faces sharing a material becomes one face",
+        "region_face_set": "By Face Set",
+        "region_face_set_desc": "Each connected group of faces sharing a face set becomes one face",
+        "panel_label": "Flat Surface Cleaner",
+        "section_plane": "Plane / Rebuild:",
+        "section_contour": "Boundary:",
+        "operator_label": "Flatten and Rebuild as 1 Face",
+        "analyze_label": "Analyze (Dry Run)",
+        "analyze_desc": "Predict the cleanup result for the selection without modifying the mesh",
+        "report_analysis": "Prediction: {loops} boundary loop(s), max deviation {deviation:.6g}, weld {welded}, dissolve {dissolved}, final face with {verts} vertices.",
+        "report_analysis_fail": "Predicted failure: {reason}",
+        "report_select_faces": "Select FACES (a face region) before running.",
+        "report_minimum_selection": "Selection too small (minimum 3 vertices).",
+        "report_no_boundary": "No boundary found. The selection does not seem to define an open cap.",
+        "report_invalid_active": "Invalid active face. Activate a face inside the selection or use 'Best Fit'.",
+        "report_invalid_selection": "Selection became invalid after weld (no faces).",
+        "report_region_lost": "The rebuilt face was undone by a neighbouring region's weld.",
+        "report_non_manifold_boundary": "Invalid boundary: a vertex has fewer than two edges or branches.",
+        "report_invalid_loop": "Invalid boundary (could not form a closed loop).",
+        "report_invalid_loop_after_cleanup": "Invalid loop after cleanup (insufficient boundary).",
+        "report_create_face_fail": "Failed to create a single face. Boundary may self-intersect or be non-manifold.",
+        "report_no_face_sets": "The mesh has no face sets.",
+        "report_batch": "{ok} of {total} regions rebuilt.",
+        "report_region": "Region {index}/{total}: {text}",
+        "report_batch_analysis": "Prediction: {ok} of {total} regions would be rebuilt.",
+        "report_auto_tolerance": "Auto tolerance: weld {merge:.6g}, simplify {angle:.3g}°.",
+        "report_auto_tolerance_range": "Auto tolerance: weld {merge_min:.6g} to {merge_max:.6g}, simplify {angle_min:.3g}° to {angle_max:.3g}°.",
+        "report_batch_failed": "{ok} of {total} regions rebuilt; {failed} failed (first: {reason})",
+    },
+}
+
+
+def _get_language():
+    try:
+        prefs = bpy.context.preferences
+        if prefs:
+            addon = prefs.addons.get(__package__)
+            if addon and hasattr(addon, "preferences"):
+                return addon.preferences.language
+    except Exception:
+        pass
+    return DEFAULT_LANGUAGE
+
+
+def L(key: str) -> str:
+    lang = _get_language()
+    locale = LOCALE_STRINGS.get(lang) or LOCALE_STRINGS.get(DEFAULT_LANGUAGE, {})
+    fallback = LOCALE_STRINGS.get(DEFAULT_LANGUAGE, {})
+    return locale.get(key) or fallback.get(key, key)
@@ -0,0 +1,215 @@
+"""Operadores. A geometria é importada na primeira execução, não no registro."""
+
+import bmesh
+import bpy
+
+from .i18n import L
+from .topology import (
+    TOPOLOGY_INDEX,
+    normal_update_around,
+    select_only_face,
+    select_only_faces,
+    topology_index_for,
+)
+
+
+# Falhas de seleção/uso viram WARNING; as demais (geometria) viram ERROR
+_WARNING_REASONS = {"select_faces", "minimum_selection", "invalid_active"}
+
+
+# ============================================================
+# Operador principal: 1 seleção -> 1 face plana (sem internas)
+# ============================================================
+class FSC_OT_make_planar_single_face(bpy.types.Operator):
+    bl_idname = "mesh.fsc_make_planar_single_face"
+    bl_label = L("operator_label")
+    bl_options = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        ob = context.active_object
+        return ob and ob.type == "MESH" and context.mode == "EDIT_MESH"
+
+    def execute(self, context):
+        from . import geometry  # importado na primeira execução, não no registro
+
+        st = context.scene.fsc_settings
+        ob = context.active_object
+        me = ob.data
+
+        bm = bmesh.from_edit_mesh(me)
+        idx = topology_index_for(me, bm)
+
+        options = dict(
+            plane_mode=st.plane_mode,
+            remove_doubles=st.remove_doubles,
+            merge_distance=st.merge_distance,
+            simplify_boundary=st.simplify_boundary,
+            simplify_angle=st.simplify_angle,
+            keep_largest_loop=st.keep_largest_loop,
+            recalc_normals=st.recalc_normals,
+            auto_tolerance=st.auto_tolerance,
+            scale=geometry.object_diagonal(ob) if st.auto_tolerance else 0.0,
+        )
+        if st.region_source != "SELECTION":
+            return self._execute_regions(bm, me, idx, st.region_source, options)
+
+        res = geometry.make_planar_single_face(bm, idx.faces, boundary_edges=idx.boundary, **options)
+        if not res.ok:
+            level = "WARNING" if res.reason in _WARNING_REASONS else "ERROR"
+            self.report({level}, L("report_" + res.reason))
+            if not res.modified:
+                return {"CANCELLED"}
+            # a malha foi alterada antes da falha: o índice não vale mais, e a
+            # edição parcial precisa chegar à malha e ganhar um passo de undo
+            TOPOLOGY_INDEX.pop(me.as_pointer(), None)
+            for f in idx.faces:
+                if f.is_valid:
+                    normal_update_around(f)
+            bmesh.update_edit_mesh(me, loop_triangles=False, destructive=True)
+            return {"FINISHED"}
+
+        # Seleciona apenas a face final
+        select_only_face(bm, me, res.face)
+        normal_update_around(res.face)
+
+        idx.replace_region(res.face)
+        idx.own_update = True
+        bmesh.update_edit_mesh(me, loop_triangles=False, destructive=True)
+        if st.auto_tolerance:
+            self.report({"INFO"}, L("report_auto_tolerance").format(merge=res.merge_distance, angle=res.simplify_angle))
+        return {"FINISHED"}
+
+    def _execute_regions(self, bm, me, idx, region_source, options):
+        """Uma região por material/face set: tudo num só undo e num só update_edit_mesh."""
+        from . import geometry
+
+        if not idx.faces:
+            self.report({"WARNING"}, L("report_select_faces"))
+            return {"CANCELLED"}
+        if region_source == "FACE_SET" and geometry.region_key_getter(bm, region_source) is None:
+            self.report({"WARNING"}, L("report_no_face_sets"))
+            return {"CANCELLED"}
+
+        results = geometry.make_planar_single_face_regions(bm, idx.faces, region_source=region_source, **options)
+        new_faces = [r.face for r in results if r.ok and r.face.is_valid]
+        failed = [r for r in results if not r.ok or not r.face.is_valid]
+        for r in failed:
+            if r.ok:
+                r._fail("region_lost")
+
+        select_only_faces(bm, me, new_faces, previous=idx.faces)
+        for f in new_faces:
+            normal_update_around(f)
+
+        idx.rebuild(new_faces)
+        idx.own_update = True
+        bmesh.update_edit_mesh(me, loop_triangles=False, destructive=True)
+
+        if failed:
+            self.report({"WARNING"}, L("report_batch_failed").format(
+                ok=len(new_faces),
+                total=len(results),
+                failed=len(failed),
+                reason=L("report_" + failed[0].reason),
+            ))
+        else:
+            self.report({"INFO"}, L("report_batch").format(ok=len(new_faces), total=len(results)))
+        if options["auto_tolerance"]:
+            _report_tolerance_range(self, results)
+        return {"FINISHED"}
+
+
+class FSC_OT_analyze_planar_single_face(bpy.types.Operator):
+    bl_idname = "mesh.fsc_analyze_planar_single_face"
+    bl_label = L("analyze_label")
+    bl_description = L("analyze_desc")
+    bl_options = {"REGISTER"}
+
+    @classmethod
+    def poll(cls, context):
+        ob = context.active_object
+        return ob and ob.type == "MESH" and context.mode == "EDIT_MESH"
+
+    def execute(self, context):
+        from . import geometry
+
+        st = context.scene.fsc_settings
+        ob = context.active_object
+        me = ob.data
+        bm = bmesh.from_edit_mesh(me)
+        idx = topology_index_for(me, bm)
+
+        options = dict(
+            plane_mode=st.plane_mode,
+            remove_doubles=st.remove_doubles,
+            merge_distance=st.merge_distance,
+            simplify_boundary=st.simplify_boundary,
+            simplify_angle=st.simplify_angle,
+            keep_largest_loop=st.keep_largest_loop,
+            auto_tolerance=st.auto_tolerance,
+            scale=geometry.object_diagonal(ob) if st.auto_tolerance else 0.0,
+        )
+        if st.region_source != "SELECTION":
+            return self._execute_regions(bm, idx, st.region_source, options)
+
+        res = geometry.analyze_planar_single_face(bm, idx.faces, **options)
+        if not res.ok:
+            self.report({"WARNING"}, _describe_analysis(res))
+            return {"FINISHED"}
+
+        self.report({"INFO"}, _describe_analysis(res))
+        if st.auto_tolerance:
+            self.report({"INFO"}, L("report_auto_tolerance").format(merge=res.merge_distance, angle=res.simplify_angle))
+        return {"FINISHED"}
+
+    def _execute_regions(self, bm, idx, region_source, options):
+        """Uma previsão por região, com o mesmo agrupamento da execução real."""
+        from . import geometry
+
+        if not idx.faces:
+            self.report({"WARNING"}, L("report_select_faces"))
+            return {"CANCELLED"}
+        if region_source == "FACE_SET" and geometry.region_key_getter(bm, region_source) is None:
+            self.report({"WARNING"}, L("report_no_face_sets"))
+            return {"CANCELLED"}
+
+        results = geometry.analyze_planar_single_face_regions(bm, idx.faces, region_source=region_source, **options)
+        total = len(results)
+        for i, res in enumerate(results, 1):
+            text = L("report_region").format(index=i, total=total, text=_describe_analysis(res))
+            self.report({"INFO"} if res.ok else {"WARNING"}, text)
+
+        ok = sum(1 for r in results if r.ok)
+        self.report({"INFO"} if ok == total else {"WARNING"}, L("report_batch_analysis").format(ok=ok, total=total))
+        if options["auto_tolerance"]:
+            _report_tolerance_range(self, results)
+        return {"FINISHED"}
+
+
+def _describe_analysis(res):
+    """Texto do relatório de uma `PlanarFaceAnalysis`."""
+    if not res.ok:
+        return L("report_analysis_fail").format(reason=L("report_" + res.reason))
+    return L("report_analysis").format(
+        loops=res.loop_count,
+        deviation=res.max_deviation,
+        welded=res.verts_welded,
+        dissolved=res.verts_dissolved,
+        verts=res.final_vert_count,
+    )
+
+
+def _report_tolerance_range(op, results):
+    """Faixa (mín. a máx.) das tolerâncias automáticas usadas pelas regiões de um lote."""
+    used = [r for r in results if r.ok]
+    if not used:
+        return
+    merges = [r.merge_distance for r in used]
+    angles = [r.simplify_angle for r in used]
+    op.report({"INFO"}, L("report_auto_tolerance_range").format(
+        merge_min=min(merges),
+        merge_max=max(merges),
+        angle_min=min(angles),
+        angle_max=max(angles),
+    ))
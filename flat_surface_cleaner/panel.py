@@ -0,0 +1,51 @@
+"""Painel da Sidebar (N) > Mesh."""
+
+import bpy
+
+from .i18n import L
+
+
+# ============================================================
+# Painel
+# ============================================================
+class FSC_PT_panel(bpy.types.Panel):
+    bl_label = L("panel_label")
+    bl_idname = "FSC_PT_panel"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Mesh"
+
+    @classmethod
+    def poll(cls, context):
+        ob = context.active_object
+        return ob and ob.type == "MESH"
+
+    def draw(self, context):
+        layout = self.layout
+        st = context.scene.fsc_settings
+
+        col = layout.column(align=True)
+        col.label(text=L("section_plane"))
+        col.prop(st, "region_source", text=L("region_source"))
+        col.prop(st, "plane_mode", text=L("plane_mode"))
+        col.prop(st, "keep_largest_loop", text=L("keep_largest_loop"))
+
+        layout.separator()
+
+        col = layout.column(align=True)
+        col.label(text=L("section_contour"))
+        col.prop(st, "auto_tolerance", text=L("auto_tolerance"))
+        col.prop(st, "remove_doubles", text=L("remove_doubles"))
+        sub = col.column(align=True)
+        sub.enabled = st.remove_doubles and not st.auto_tolerance
+        sub.prop(st, "merge_distance", text=L("merge_distance"))
+        col.prop(st, "simplify_boundary", text=L("simplify_boundary"))
+        sub = col.column(align=True)
+        sub.enabled = st.simplify_boundary and not st.auto_tolerance
+        sub.prop(st, "simplify_angle", text=L("simplify_angle"))
+
+        layout.prop(st, "recalc_normals", text=L("recalc_normals"))
+
+        layout.separator()
+        layout.operator("mesh.fsc_make_planar_single_face", icon="MESH_GRID", text=L("operator_label"))
+        layout.operator("mesh.fsc_analyze_planar_single_face", icon="VIEWZOOM", text=L("analyze_label"))
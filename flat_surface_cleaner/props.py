@@ -0,0 +1,107 @@
+"""Propriedades da cena e preferências do add-on."""
+
+import bpy
+
+from .i18n import DEFAULT_LANGUAGE, L
+
+
+# ============================================================
+# Itens dinâmicos
+# ============================================================
+def _plane_mode_items(self, _context):
+    return [
+        ("BEST_FIT", L("plane_best_fit"), L("plane_best_fit_desc")),
+        ("ACTIVE", L("plane_active"), L("plane_active_desc")),
+        ("AVERAGE", L("plane_average"), L("plane_average_desc")),
+    ]
+
+
+def _region_source_items(self, _context):
+    return [
+        ("SELECTION", L("region_selection"), L("region_selection_desc")),
+        ("MATERIAL", L("region_material"), L("region_material_desc")),
+        ("FACE_SET", L("region_face_set"), L("region_face_set_desc")),
+    ]
+
+
+# ============================================================
+# Propriedades / UI
+# ============================================================
+class FSC_Settings(bpy.types.PropertyGroup):
+    region_source: bpy.props.EnumProperty(
+        name=L("region_source"),
+        description=L("region_source_desc"),
+        items=_region_source_items,
+        default="SELECTION",
+    )
+
+    plane_mode: bpy.props.EnumProperty(
+        name=L("plane_mode"),
+        description=L("plane_mode_desc"),
+        items=_plane_mode_items,
+        default="BEST_FIT",
+    )
+
+    remove_doubles: bpy.props.BoolProperty(
+        name=L("remove_doubles"),
+        description=L("remove_doubles_desc"),
+        default=True,
+    )
+
+    merge_distance: bpy.props.FloatProperty(
+        name=L("merge_distance"),
+        default=0.0001,
+        min=0.0,
+        max=0.1,
+        precision=6,
+    )
+
+    simplify_boundary: bpy.props.BoolProperty(
+        name=L("simplify_boundary"),
+        description=L("simplify_boundary_desc"),
+        default=False,
+    )
+
+    simplify_angle: bpy.props.FloatProperty(
+        name=L("simplify_angle"),
+        description=L("simplify_angle_desc"),
+        default=0.2,
+        min=0.0,
+        max=5.0,
+    )
+
+    auto_tolerance: bpy.props.BoolProperty(
+        name=L("auto_tolerance"),
+        description=L("auto_tolerance_desc"),
+        default=False,
+    )
+
+    keep_largest_loop: bpy.props.BoolProperty(
+        name=L("keep_largest_loop"),
+        description=L("keep_largest_loop_desc"),
+        default=True,
+    )
+
+    recalc_normals: bpy.props.BoolProperty(
+        name=L("recalc_normals"),
+        default=True,
+    )
+
+
+class FSC_AddonPreferences(bpy.types.AddonPreferences):
+    bl_idname = __package__
+
+    language: bpy.props.EnumProperty(
+        name=L("prefs_language"),
+        description=L("prefs_language_desc"),
+        items=[
+            ("PT", "Português", "Mostrar labels e mensagens em português"),
+            ("EN", "English", "Show labels and messages in English"),
+        ],
+        default=DEFAULT_LANGUAGE,
+    )
+
+    def draw(self, context):
+        layout = self.layout
+        layout.label(text=L("prefs_language_label"))
+        layout.prop(self, "language", text=L("prefs_language_prop"))
@@ -0,0 +1,137 @@
+"""Estimativa automática de weld/simplificação por histogramas do contorno.
+
+Carregado sob demanda (só com "Tolerância Automática"), junto com o NumPy.
+"""
+
+import math
+
+try:
+    import numpy as np  # incluso no Blender; usado só para acelerar histogramas
+except ImportError:
+    np = None
+
+
+# ============================================================
+# Tolerâncias automáticas (histogramas do contorno)
+# ============================================================
+# Largura dos bins em décadas (escala log10) e nº mínimo de bins vazios
+# para considerar que há um "vão" separando ruído de geometria real.
+_TOL_BIN_WIDTH = 0.25
+_TOL_MIN_GAP_BINS = 2
+_TOL_ANGLE_MIN = 0.01
+_TOL_ANGLE_MAX = 5.0
+# Arestas só contam como duplicatas (weld pelo vão) abaixo desta fração da diagonal
+_TOL_DUP_FRACTION = 1e-5
+
+
+def _log_histogram(values, lo, hi):
+    """Histograma de log10(values) com bins de `_TOL_BIN_WIDTH` entre lo e hi."""
+    nbins = max(1, int(math.ceil((hi - lo) / _TOL_BIN_WIDTH)))
+    if np is not None:
+        counts, _edges = np.histogram(np.log10(np.asarray(values, dtype=np.float64)),
+                                      bins=nbins, range=(lo, lo + nbins * _TOL_BIN_WIDTH))
+        return counts.tolist()
+    counts = [0] * nbins
+    for x in values:
+        i = int((math.log10(x) - lo) / _TOL_BIN_WIDTH)
+        counts[min(max(i, 0), nbins - 1)] += 1
+    return counts
+
+
+def _gap_threshold(counts, lo, ref_bin):
+    """Centro (em log10) do maior vão de bins vazios antes de `ref_bin`, ou None.
+
+    Só vale vão com contagens acima dele: sem elas (p.ex. um círculo tesselado,
+    todo com o mesmo giro) o grupo de baixo é a própria geometria, não ruído.
+    """
+    first = next((i for i, c in enumerate(counts) if c), None)
+    if first is None:
+        return None
+    best = None
+    run_start = None
+    for i in range(first + 1, ref_bin + 1):
+        if counts[i] == 0:
+            if run_start is None:
+                run_start = i
+        elif run_start is not None:
+            if best is None or i - run_start > best[1] - best[0]:
+                best = (run_start, i)
+            run_start = None
+    if (run_start is not None and any(counts[ref_bin + 1:])
+            and (best is None or ref_bin + 1 - run_start > best[1] - best[0])):
+        # vão que se estende até o bin de referência (p.ex. nenhum canto abaixo de 5°)
+        best = (run_start, ref_bin + 1)
+    if best is None or best[1] - best[0] < _TOL_MIN_GAP_BINS:
+        return None
+    return lo + 0.5 * (best[0] + best[1]) * _TOL_BIN_WIDTH
+
+
+def estimate_tolerances(boundary_edges, co_of, scale: float):
+    """Escolhe (merge_distance, simplify_angle em graus) a partir do contorno.
+
+    O weld fica no vão entre arestas degeneradas (duplicatas de boolean/import)
+    e as arestas reais; o ângulo, no vão entre o ruído quase colinear e os
+    cantos de verdade. Sem vão claro, usa frações conservadoras. O grupo curto
+    só é tratado como duplicata se for quase degenerado (abaixo de
+    `_TOL_DUP_FRACTION` x `scale`, a diagonal do objeto); chanfros e detalhes
+    curtos reais caem no recuo conservador. `scale` também limita o weld por
+    baixo à precisão numérica; por cima, o limite é relativo (10% da aresta
+    mediana), então o valor acompanha a unidade da cena e pode passar da faixa
+    da propriedade. O ângulo fica sempre abaixo do giro do grupo principal de
+    vértices (p.ex. um círculo tesselado não é dissolvido).
+    """
+    lengths = []
+    neigh = {}
+    for e in boundary_edges:
+        a, b = e.verts[0], e.verts[1]
+        ln = (co_of(a) - co_of(b)).length
+        if ln > 0.0:
+            lengths.append(ln)
+        neigh.setdefault(a, []).append(b)
+        neigh.setdefault(b, []).append(a)
+    if not lengths:
+        return 0.0001, 0.2
+
+    floor = max(scale, 1e-12) * 1e-7
+    lengths.sort()
+    median = lengths[len(lengths) // 2]
+    lo = math.log10(max(lengths[0], floor))
+    hi = math.log10(lengths[-1]) + _TOL_BIN_WIDTH
+    counts = _log_histogram([max(x, floor) for x in lengths], lo, hi)
+    ref_bin = min(int((math.log10(median) - lo) / _TOL_BIN_WIDTH), len(counts) - 1)
+    gap = _gap_threshold(counts, lo, ref_bin)
+    if gap is not None and max(x for x in lengths if math.log10(x) < gap) <= _TOL_DUP_FRACTION * scale:
+        merge = 10.0 ** gap
+    else:
+        # sem duplicatas evidentes: não deixa o weld colapsar nenhuma aresta real
+        merge = min(median * 1e-3, lengths[0] * 0.5)
+    merge = min(max(merge, floor), 0.1 * median)
+
+    # desvio de colinearidade (0° = colinear) em cada vértice de grau 2
+    turns = []
+    for v, nb in neigh.items():
+        if len(nb) != 2:
+            continue
+        a = co_of(nb[0]) - co_of(v)
+        b = co_of(nb[1]) - co_of(v)
+        if a.length < 1e-12 or b.length < 1e-12:
+            continue
+        turns.append(max(180.0 - math.degrees(a.angle(b)), 1e-6))
+    angle = 0.2
+    if turns:
+        lo_a = math.log10(min(turns))
+        counts = _log_histogram(turns, lo_a, math.log10(180.0) + _TOL_BIN_WIDTH)
+        ref_bin = min(int((math.log10(_TOL_ANGLE_MAX) - lo_a) / _TOL_BIN_WIDTH), len(counts) - 1)
+        gap = _gap_threshold(counts, lo_a, ref_bin) if ref_bin > 0 else None
+        if gap is not None:
+            angle = 10.0 ** gap
+            main = [t for t in turns if t > angle]
+        else:
+            # sem vão: o bin mais cheio é geometria real (p.ex. giro uniforme de uma curva)
+            top = max(range(len(counts)), key=counts.__getitem__)
+            main = [t for t in turns if int((math.log10(t) - lo_a) / _TOL_BIN_WIDTH) >= top]
+    angle = min(max(angle, _TOL_ANGLE_MIN), _TOL_ANGLE_MAX)
+    if turns:
+        # nunca alcança o giro do grupo principal, senão a simplificação o apaga inteiro
+        angle = min(angle, 0.5 * min(main))
+    return merge, angle
@@ -0,0 +1,165 @@
+"""Índice de topologia por malha e handler de depsgraph que o invalida.
+
+Leve: registrado no startup junto com a UI.
+"""
+
+from bpy.app.handlers import persistent
+
+
+# ============================================================
+# Índice de topologia persistente (por malha)
+# ============================================================
+def selected_faces(bm):
+    return [f for f in bm.faces if f.select]
+
+
+# Chave: ponteiro da Mesh original. Mantido entre execuções do operador,
+# atualizado com as edições do próprio operador e invalidado pelo handler
+# de depsgraph quando outra coisa altera a geometria. A adjacência
+# aresta->faces da malha inteira não é duplicada aqui: a BMesh já a mantém
+# (`e.link_faces`) e a atualiza a cada edição.
+TOPOLOGY_INDEX = {}
+
+
+class _TopologyIndex:
+    """Região selecionada e seu contorno (arestas usadas por uma só face da região)."""
+
+    __slots__ = ("bm", "faces", "boundary", "own_update")
+
+    def __init__(self, bm, faces):
+        self.bm = bm
+        self.own_update = False
+        self.rebuild(faces)
+
+    def rebuild(self, faces):
+        self.faces = set(faces)
+        counts = {}
+        for f in self.faces:
+            for e in f.edges:
+                counts[e] = counts.get(e, 0) + 1
+        self.boundary = {e for e, c in counts.items() if c == 1}
+
+    def is_current(self, bm, me) -> bool:
+        """Valida o cache em O(região): mesma BMesh e mesma seleção de faces."""
+        if self.bm is not bm or not bm.is_valid:
+            return False
+        if len(self.faces) != me.total_face_sel:
+            return False
+        return all(f.is_valid and f.select for f in self.faces)
+
+    def replace_region(self, face):
+        """Atualização incremental após o rebuild: a região passa a ser a face nova."""
+        self.rebuild((face,))
+
+
+def _selection_seeds(bm, idx):
+    """Faces de partida para achar a seleção: ativa, histórico e região anterior."""
+    seeds = []
+    if bm.faces.active is not None:
+        seeds.append(bm.faces.active)
+    for ele in bm.select_history:
+        # BMVert/BMEdge: faces ligadas ao elemento clicado
+        seeds.extend(ele.link_faces if hasattr(ele, "link_faces") else (ele,))
+    if idx is not None and idx.bm is bm:
+        seeds.extend(idx.faces)
+    return seeds
+
+
+def _grow_selection(seeds):
+    """Faces selecionadas conectadas (por vértice) às sementes; custo O(região)."""
+    found = set()
+    stack = []
+    for f in seeds:
+        if f.is_valid and f.select and f not in found:
+            found.add(f)
+            stack.append(f)
+    while stack:
+        f = stack.pop()
+        for v in f.verts:
+            for lf in v.link_faces:
+                if lf.select and lf not in found:
+                    found.add(lf)
+                    stack.append(lf)
+    return found
+
+
+def topology_index_for(me, bm):
+    """Retorna o índice da malha sem varrer todas as faces sempre que possível.
+
+    A seleção nova é encontrada crescendo a partir da face ativa, do histórico
+    de seleção e da região anterior; `me.total_face_sel` (mantido pela BMesh)
+    confirma que nada ficou de fora. Só seleções desconexas sem semente (p.ex.
+    box select em ilhas separadas) caem na varredura completa.
+    """
+    key = me.as_pointer()
+    idx = TOPOLOGY_INDEX.get(key)
+    if idx is not None and idx.is_current(bm, me):
+        return idx
+    faces = _grow_selection(_selection_seeds(bm, idx))
+    if len(faces) != me.total_face_sel:
+        faces = selected_faces(bm)
+    idx = _TopologyIndex(bm, faces)
+    TOPOLOGY_INDEX[key] = idx
+    return idx
+
+
+def select_only_faces(bm, me, faces, previous=()):
+    """Deixa apenas `faces` selecionadas; só varre a malha se sobrar seleção fora delas.
+
+    `previous` são as faces da região anterior ainda válidas (p.ex. regiões que
+    falharam num lote); são desmarcadas antes da conferência dos totais.
+    """
+    for f in previous:
+        if f.is_valid:
+            f.select = False
+    for f in faces:
+        f.select = True
+    edges = {e for f in faces for e in f.edges}
+    verts = {v for f in faces for v in f.verts}
+    if (me.total_face_sel != len(faces)
+            or me.total_edge_sel != len(edges)
+            or me.total_vert_sel != len(verts)):
+        for v in bm.verts:
+            v.select = False
+        for e in bm.edges:
+            e.select = False
+        for f in bm.faces:
+            f.select = False
+        for f in faces:
+            f.select = True
+    if faces:
+        bm.faces.active = faces[0]
+
+
+def select_only_face(bm, me, face):
+    """Deixa apenas `face` selecionada (ver `select_only_faces`)."""
+    select_only_faces(bm, me, [face])
+
+
+def normal_update_around(face):
+    """Atualiza normais só da face nova e das faces que tocam o contorno."""
+    faces = {face}
+    for v in face.verts:
+        faces.update(v.link_faces)
+    for f in faces:
+        f.normal_update()
+    for v in face.verts:
+        v.normal_update()
+
+
+@persistent
+def depsgraph_update_post(_scene, depsgraph):
+    if not TOPOLOGY_INDEX:
+        return
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry:
+            continue
+        key = update.id.original.as_pointer()
+        idx = TOPOLOGY_INDEX.get(key)
+        if idx is None:
+            continue
+        if idx.own_update:
+            # update disparado pelo próprio operador: o índice já está em dia
+            idx.own_update = False
+        else:
+            del TOPOLOGY_INDEX[key]
@@ -0,0 +1,1101 @@
+#!/usr/bin/env python3
+"""Limpeza de superfícies planas em arquivos OBJ/PLY, sem Blender.
+
+Aplica a mesma lógica do add-on (`flat_surface_cleaner`): plano de ajuste, weld,
+simplificação do contorno e reconstrução de cada região como uma única face.
+As regiões vêm de uma varredura coplanar com tolerância ou das tags do
+arquivo (grupo/material no OBJ, propriedade inteira de face no PLY).
+
+Uso:
+    python fsc_cli.py peca.obj outra.ply [-o saida/] [--jobs 4]
+    python fsc_cli.py peca.ply --regions tags --tag-property material_index
+    python fsc_cli.py peca.obj --regions coplanar --angle 0.5 --simplify
+
+PLY binário é lido via mmap e regravado em streaming (os registros de
+vértice são copiados do arquivo de origem). OBJ é lido linha a linha; `vt`/`vn`
+são preservados nas faces intocadas e descartados só nas reconstruídas, que
+não têm cantos correspondentes. As demais linhas (o, g, s, l, comentários...)
+são copiadas na mesma posição; índices de `l`/`p` acompanham os vértices.
+Com `--jobs`, vários arquivos são processados em paralelo (um por processo).
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Tamanho do buffer de escrita em streaming
+CHUNK_SIZE = 1 << 20
+
+PLY_TYPES = {
+    "char": "b", "int8": "b",
+    "uchar": "B", "uint8": "B",
+    "short": "h", "int16": "h",
+    "ushort": "H", "uint16": "H",
+    "int": "i", "int32": "i",
+    "uint": "I", "uint32": "I",
+    "float": "f", "float32": "f",
+    "double": "d", "float64": "d",
+}
+
+# Maior contagem representável por tipo inteiro (prefixo das listas de face)
+PLY_COUNT_MAX = {"b": 127, "B": 255, "h": 32767, "H": 65535, "i": 2 ** 31 - 1, "I": 2 ** 32 - 1}
+
+# Propriedades de face procuradas (em ordem) quando `--tag-property` não é dado
+PLY_TAG_CANDIDATES = ("material_index", "face_set", "material", "group")
+
+
+# ============================================================
+# Vetores (tuplas) e plano de melhor ajuste
+# ============================================================
+def _sub(a, b):
+    return (a[0] - b[0], a[1] - b[1], a[2] - b[2])
+
+
+def _add(a, b):
+    return (a[0] + b[0], a[1] + b[1], a[2] + b[2])
+
+
+def _scale(a, s):
+    return (a[0] * s, a[1] * s, a[2] * s)
+
+
+def _dot(a, b):
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _cross(a, b):
+    return (a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
+
+
+def _length(a):
+    return math.sqrt(_dot(a, a))
+
+
+def _normalized(a):
+    ln = _length(a)
+    if ln < 1e-12:
+        return (0.0, 0.0, 0.0)
+    return _scale(a, 1.0 / ln)
+
+
+def _angle(a, b):
+    la, lb = _length(a), _length(b)
+    c = _dot(a, b) / (la * lb)
+    return math.acos(max(-1.0, min(1.0, c)))
+
+
+def _solve_3x3(A, b):
+    """Resolve A x = b por eliminação de Gauss com pivoteamento parcial."""
+    m = [list(A[0]) + [b[0]], list(A[1]) + [b[1]], list(A[2]) + [b[2]]]
+    for i in range(3):
+        pivot = max(range(i, 3), key=lambda r: abs(m[r][i]))
+        if abs(m[pivot][i]) < 1e-14:
+            raise ZeroDivisionError("Matriz singular/quase singular.")
+        m[i], m[pivot] = m[pivot], m[i]
+        piv = m[i][i]
+        for r in range(i + 1, 3):
+            f = m[r][i] / piv
+            for c in range(i, 4):
+                m[r][c] -= f * m[i][c]
+    x = [0.0, 0.0, 0.0]
+    for i in (2, 1, 0):
+        s = m[i][3]
+        for j in range(i + 1, 3):
+            s -= m[i][j] * x[j]
+        x[i] = s / m[i][i]
+    return (x[0], x[1], x[2])
+
+
+def _best_fit_plane(pts):
+    """Retorna (normal, ponto_no_plano) via covariância + inverse iteration."""
+    n_pts = len(pts)
+    c = (0.0, 0.0, 0.0)
+    for p in pts:
+        c = _add(c, p)
+    c = _scale(c, 1.0 / n_pts)
+
+    xx = xy = xz = yy = yz = zz = 0.0
+    for p in pts:
+        rx, ry, rz = _sub(p, c)
+        xx += rx * rx
+        xy += rx * ry
+        xz += rx * rz
+        yy += ry * ry
+        yz += ry * rz
+        zz += rz * rz
+
+    eps = 1e-12 * (xx + yy + zz + 1.0)
+    A = ((xx + eps, xy, xz), (xy, yy + eps, yz), (xz, yz, zz + eps))
+
+    x = _normalized((1.0, 0.3, 0.2))
+    for _ in range(24):
+        try:
+            y = _solve_3x3(A, x)
+        except ZeroDivisionError:
+            return (0.0, 0.0, 1.0), c
+        ln = _length(y)
+        if ln < 1e-14:
+            break
+        x = _scale(y, 1.0 / ln)
+    return x, c
+
+
+def _plane_basis(n):
+    """Base ortonormal (u, v) no plano de normal `n`."""
+    ax = min(range(3), key=lambda i: abs(n[i]))
+    axis = [0.0, 0.0, 0.0]
+    axis[ax] = 1.0
+    u = _normalized(_cross(n, tuple(axis)))
+    v = _cross(n, u)
+    return u, v
+
+
+def _newell(pts):
+    """Normal de Newell (comprimento = 2x área) de um polígono."""
+    nx = ny = nz = 0.0
+    count = len(pts)
+    for i in range(count):
+        x1, y1, z1 = pts[i]
+        x2, y2, z2 = pts[(i + 1) % count]
+        nx += (y1 - y2) * (z1 + z2)
+        ny += (z1 - z2) * (x1 + x2)
+        nz += (x1 - x2) * (y1 + y2)
+    return (nx, ny, nz)
+
+
+def _poly_area_2d(pts, origin, u, v):
+    """Área (módulo) do polígono projetado no plano."""
+    if len(pts) < 3:
+        return 0.0
+    pts2 = []
+    for p in pts:
+        d = _sub(p, origin)
+        pts2.append((_dot(d, u), _dot(d, v)))
+    area = 0.0
+    for i in range(len(pts2)):
+        x1, y1 = pts2[i]
+        x2, y2 = pts2[(i + 1) % len(pts2)]
+        area += x1 * y2 - x2 * y1
+    return abs(area) * 0.5
+
+
+# ============================================================
+# Malha indexada
+# ============================================================
+class _Mesh:
+    """Malha mínima: coordenadas planas, faces como listas de índices e tags por face."""
+
+    def __init__(self):
+        self.co = array("d")
+        self.faces = []
+        self.tags = {}       # tipo de tag -> array('i') com um valor por face (-1 = sem tag)
+        self.tag_names = {}  # tipo de tag -> lista de nomes (OBJ)
+        self.dead = set()    # vértices removidos
+        self.moved = set()   # vértices com coordenadas alteradas
+        self.vert_faces = None
+        self.header = []     # OBJ: linhas anteriores aos dados (mtllib, comentários)
+        self.attr_lines = []  # OBJ: linhas vt/vn, na ordem do arquivo
+        self.corners = None  # OBJ: por face, sufixos "/vt/vn" de cada canto (None = sem atributos)
+        self.stream = []     # OBJ: ordem de saída (índice de face, linha literal ou elemento l/p)
+        self.welded = {}     # vértice soldado -> representante
+        self.keep_verts = set()  # vértices usados por l/p: não são removidos como geometria solta
+        self.ply = None      # PLY: mmap e layout do arquivo de origem
+
+    @property
+    def vert_count(self) -> int:
+        return len(self.co) // 3
+
+    def vert(self, i):
+        j = 3 * i
+        return (self.co[j], self.co[j + 1], self.co[j + 2])
+
+    def set_vert(self, i, p):
+        j = 3 * i
+        self.co[j], self.co[j + 1], self.co[j + 2] = p
+        self.moved.add(i)
+
+    def build_adjacency(self):
+        vf = [[] for _ in range(self.vert_count)]
+        for fi, f in enumerate(self.faces):
+            for v in f:
+                vf[v].append(fi)
+        self.vert_faces = vf
+
+    def link_faces(self, v):
+        """Faces vivas que usam o vértice `v` (limpa entradas obsoletas)."""
+        faces = self.faces
+        live = list(dict.fromkeys(fi for fi in self.vert_faces[v] if faces[fi] is not None and v in faces[fi]))
+        self.vert_faces[v] = live
+        return live
+
+    def face_normal(self, fi):
+        return _normalized(_newell([self.vert(v) for v in self.faces[fi]]))
+
+    def set_face(self, fi, verts, corners=None):
+        """Substitui a face; sem `corners`, ela fica sem atributos de canto (face reconstruída)."""
+        self.faces[fi] = verts
+        if self.corners is not None:
+            self.corners[fi] = corners
+        if verts is not None:
+            for v in verts:
+                self.vert_faces[v].append(fi)
+
+    def edit_face(self, fi, verts, remap=None):
+        """Troca os vértices de uma face existente mantendo os atributos de canto.
+
+        `remap` (vértice soldado -> representante) casa os cantos antigos com os
+        novos; se algum canto novo não tiver correspondente, a face perde os
+        atributos.
+        """
+        corners = None
+        old = self.corners[fi] if self.corners is not None else None
+        if old is not None:
+            by_vert = {}
+            for v, c in zip(self.faces[fi], old):
+                by_vert.setdefault(remap.get(v, v) if remap else v, c)
+            if all(v in by_vert for v in verts):
+                corners = [by_vert[v] for v in verts]
+        self.set_face(fi, verts, corners)
+
+    def bbox_diagonal(self) -> float:
+        if not self.co:
+            return 0.0
+        lo = [min(self.co[k::3]) for k in range(3)]
+        hi = [max(self.co[k::3]) for k in range(3)]
+        return _length(_sub(hi, lo))
+
+
+def _edge_key(a, b):
+    return (a, b) if a < b else (b, a)
+
+
+def _boundary_edges(mesh, region):
+    counts = {}
+    for fi in region:
+        f = mesh.faces[fi]
+        for i in range(len(f)):
+            k = _edge_key(f[i], f[(i + 1) % len(f)])
+            counts[k] = counts.get(k, 0) + 1
+    return {k for k, c in counts.items() if c == 1}
+
+
+def _boundary_loops(edges):
+    """Loops ordenados do contorno; None se algum vértice não tiver grau 2."""
+    adj = {}
+    for a, b in edges:
+        adj.setdefault(a, []).append(b)
+        adj.setdefault(b, []).append(a)
+    if not adj or any(len(n) != 2 for n in adj.values()):
+        return None
+    seen = set()
+    loops = []
+    for start in adj:
+        if start in seen:
+            continue
+        loop = [start]
+        seen.add(start)
+        prev, curr = None, start
+        while True:
+            n0, n1 = adj[curr]
+            nxt = n0 if n0 != prev else n1
+            if nxt == start or nxt in seen:
+                break
+            loop.append(nxt)
+            seen.add(nxt)
+            prev, curr = curr, nxt
+        if len(loop) >= 3:
+            loops.append(loop)
+    return loops
+
+
+def _dedupe_cycle(verts):
+    """Remove vértices repetidos consecutivos (inclusive entre último e primeiro)."""
+    out = []
+    for v in verts:
+        if not out or out[-1] != v:
+            out.append(v)
+    while len(out) > 1 and out[0] == out[-1]:
+        out.pop()
+    return out
+
+
+def _weld(mesh, verts, dist: float):
+    """Agrupa vértices a menos de `dist` (grade espacial). Retorna {vértice: representante}."""
+    inv = 1.0 / dist
+    grid = {}
+    parent = {}
+
+    def find(v):
+        while parent[v] != v:
+            parent[v] = parent[parent[v]]
+            v = parent[v]
+        return v
+
+    dist2 = dist * dist
+    for v in sorted(verts):
+        parent[v] = v
+        p = mesh.vert(v)
+        cx, cy, cz = (int(math.floor(c * inv)) for c in p)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for dz in (-1, 0, 1):
+                    for o in grid.get((cx + dx, cy + dy, cz + dz), ()):
+                        d = _sub(mesh.vert(o), p)
+                        if _dot(d, d) <= dist2:
+                            ra, rb = find(o), find(v)
+                            if ra != rb:
+                                parent[max(ra, rb)] = min(ra, rb)
+        grid.setdefault((cx, cy, cz), []).append(v)
+    return {v: find(v) for v in parent if find(v) != v}
+
+
+# ============================================================
+# Limpeza de uma região (mesma sequência do add-on)
+# ============================================================
+class CleanOptions:
+    """Opções da limpeza; espelham as propriedades do add-on."""
+
+    def __init__(self, plane_mode="BEST_FIT", remove_doubles=True, merge_distance=0.0001,
+                 simplify_boundary=False, simplify_angle=0.2, keep_largest_loop=True):
+        self.plane_mode = plane_mode
+        self.remove_doubles = remove_doubles
+        self.merge_distance = merge_distance
+        self.simplify_boundary = simplify_boundary
+        self.simplify_angle = simplify_angle
+        self.keep_largest_loop = keep_largest_loop
+
+
+def _kill_face(mesh, fi):
+    mesh.faces[fi] = None
+
+
+def clean_region(mesh, region, opts: CleanOptions, stats=None):
+    """Planariza `region` (índices de faces) e a substitui por uma única face.
+
+    Retorna None em caso de sucesso ou o código da falha (mesmos códigos da
+    API do add-on, p.ex. `non_manifold_boundary`).
+    """
+    faces = mesh.faces
+    region = [fi for fi in region if faces[fi] is not None]
+    if not region:
+        return "select_faces"
+    rverts = {v for fi in region for v in faces[fi]}
+    if len(rverts) < 3:
+        return "minimum_selection"
+
+    boundary = _boundary_edges(mesh, region)
+    if not boundary:
+        if len(region) == 1:
+            n, p0 = _best_fit_plane([mesh.vert(v) for v in rverts])
+            _project(mesh, rverts, p0, n)
+            return None
+        return "no_boundary"
+
+    # Plano final e orientação de referência (para a face nova)
+    ref = (0.0, 0.0, 0.0)
+    for fi in region:
+        ref = _add(ref, _newell([mesh.vert(v) for v in faces[fi]]))
+    if opts.plane_mode == "AVERAGE" and _length(ref) > 1e-12:
+        normal = _normalized(ref)
+        origin = (0.0, 0.0, 0.0)
+        for v in rverts:
+            origin = _add(origin, mesh.vert(v))
+        origin = _scale(origin, 1.0 / len(rverts))
+    else:
+        normal, origin = _best_fit_plane([mesh.vert(v) for v in rverts])
+
+    _project(mesh, rverts, origin, normal)
+
+    # Weld (afeta também as faces vizinhas que usam os vértices soldados)
+    if opts.remove_doubles and opts.merge_distance > 0.0:
+        remap = _weld(mesh, rverts, opts.merge_distance)
+        if remap:
+            touched = {fi for v in remap for fi in mesh.link_faces(v)}
+            for fi in touched:
+                f = _dedupe_cycle([remap.get(v, v) for v in faces[fi]])
+                if len(set(f)) < 3:
+                    _kill_face(mesh, fi)
+                else:
+                    mesh.edit_face(fi, f, remap)
+            mesh.dead.update(remap)
+            mesh.welded.update(remap)
+            if stats is not None:
+                stats["welded"] += len(remap)
+        region = [fi for fi in region if faces[fi] is not None]
+        if not region:
+            return "invalid_selection"
+        rverts = {v for fi in region for v in faces[fi]}
+        boundary = _boundary_edges(mesh, region)
+
+    loops = _boundary_loops(boundary)
+    if loops is None:
+        return "non_manifold_boundary"
+    if not loops:
+        return "invalid_loop"
+
+    region_set = set(region)
+    if opts.keep_largest_loop and len(loops) > 1:
+        u, v = _plane_basis(normal)
+        loops.sort(key=lambda lp: _poly_area_2d([mesh.vert(x) for x in lp], origin, u, v), reverse=True)
+        loop = loops[0]
+        # como no add-on: apagar as arestas dos loops menores apaga as faces que as usam
+        keep = {_edge_key(loop[i], loop[(i + 1) % len(loop)]) for i in range(len(loop))}
+        for a, b in boundary - keep:
+            for fi in set(mesh.link_faces(a)) & set(mesh.link_faces(b)):
+                if fi not in region_set:
+                    _kill_face(mesh, fi)
+    else:
+        loop = loops[0]
+
+    # Simplifica contorno: só vértices colineares usados por no máximo uma face vizinha
+    if opts.simplify_boundary and opts.simplify_angle > 0.0 and len(loop) >= 4:
+        tol = math.radians(opts.simplify_angle)
+        drop = set()
+        count = len(loop)
+        for i in range(count):
+            p = mesh.vert(loop[i])
+            a = _sub(mesh.vert(loop[i - 1]), p)
+            b = _sub(mesh.vert(loop[(i + 1) % count]), p)
+            if _length(a) < 1e-12 or _length(b) < 1e-12:
+                continue
+            if abs(math.pi - _angle(a, b)) > tol:
+                continue
+            outside = [fi for fi in mesh.link_faces(loop[i]) if fi not in region_set]
+            if len(outside) <= 1:
+                drop.add(loop[i])
+        if len(loop) - len(drop) >= 3 and drop:
+            for v in drop:
+                for fi in mesh.link_faces(v):
+                    if fi in region_set:
+                        continue
+                    f = [x for x in faces[fi] if x != v]
+                    if len(f) < 3:
+                        _kill_face(mesh, fi)
+                    else:
+                        mesh.edit_face(fi, f)
+            loop = [v for v in loop if v not in drop]
+            if stats is not None:
+                stats["dissolved"] += len(drop)
+
+    # Remove as faces da região e a geometria interna que ficou solta
+    for fi in region:
+        _kill_face(mesh, fi)
+    loop_set = set(loop)
+    for v in rverts:
+        if v not in loop_set and v not in mesh.keep_verts and not mesh.link_faces(v):
+            mesh.dead.add(v)
+
+    if len(loop) < 3:
+        return "invalid_loop_after_cleanup"
+
+    if _dot(_newell([mesh.vert(v) for v in loop]), ref) < 0.0:
+        loop.reverse()
+    # a face nova ocupa o lugar da primeira face da região (herda as tags)
+    mesh.set_face(region[0], loop)
+    if stats is not None:
+        stats["faces_removed"] += len(region)
+    return None
+
+
+def _project(mesh, verts, origin, normal):
+    for v in verts:
+        p = mesh.vert(v)
+        d = _dot(_sub(p, origin), normal)
+        mesh.set_vert(v, _sub(p, _scale(normal, d)))
+
+
+# ============================================================
+# Escolha das regiões
+# ============================================================
+def _face_adjacency(mesh, merge_distance: float = 0.0):
+    """Função face -> faces vizinhas por aresta, unindo vértices a até `merge_distance`.
+
+    Costuras com vértices duplicados (o caso que o weld corrige) não separam
+    a região; com `merge_distance` 0 vale só o índice compartilhado.
+    """
+    canon = _weld(mesh, range(mesh.vert_count), merge_distance) if merge_distance > 0.0 else {}
+    faces = mesh.faces
+
+    def edge_keys(f):
+        for i in range(len(f)):
+            a, b = canon.get(f[i - 1], f[i - 1]), canon.get(f[i], f[i])
+            if a != b:
+                yield _edge_key(a, b)
+
+    edge_faces = {}
+    for fi, f in enumerate(faces):
+        if f is not None:
+            for k in edge_keys(f):
+                edge_faces.setdefault(k, []).append(fi)
+
+    def neighbors(fi):
+        return {other for k in edge_keys(faces[fi]) for other in edge_faces[k] if other != fi}
+
+    return neighbors
+
+
+def coplanar_regions(mesh, angle_deg: float, plane_tol: float, merge_distance: float = 0.0):
+    """Componentes conexas de faces com normal e plano dentro da tolerância da face semente."""
+    cos_tol = math.cos(math.radians(angle_deg))
+    neighbors = _face_adjacency(mesh, merge_distance)
+    seen = bytearray(len(mesh.faces))
+    regions = []
+    for seed in range(len(mesh.faces)):
+        if seen[seed] or mesh.faces[seed] is None:
+            continue
+        seen[seed] = 1
+        n0 = mesh.face_normal(seed)
+        if _length(n0) < 0.5:
+            continue
+        p0 = mesh.vert(mesh.faces[seed][0])
+        comp = [seed]
+        stack = [seed]
+        while stack:
+            fi = stack.pop()
+            for nb in neighbors(fi):
+                if seen[nb]:
+                    continue
+                if _dot(mesh.face_normal(nb), n0) < cos_tol:
+                    continue
+                if any(abs(_dot(_sub(mesh.vert(v), p0), n0)) > plane_tol for v in mesh.faces[nb]):
+                    continue
+                seen[nb] = 1
+                comp.append(nb)
+                stack.append(nb)
+        if len(comp) > 1:
+            regions.append(comp)
+    return regions
+
+
+def tagged_regions(mesh, tags, merge_distance: float = 0.0):
+    """Agrupa faces pela tag e separa cada grupo em componentes conexas."""
+    neighbors = _face_adjacency(mesh, merge_distance)
+    seen = bytearray(len(mesh.faces))
+    regions = []
+    for seed in range(len(mesh.faces)):
+        key = tags[seed]
+        if seen[seed] or key < 0 or mesh.faces[seed] is None:
+            continue
+        seen[seed] = 1
+        comp = [seed]
+        stack = [seed]
+        while stack:
+            fi = stack.pop()
+            for nb in neighbors(fi):
+                if not seen[nb] and tags[nb] == key:
+                    seen[nb] = 1
+                    comp.append(nb)
+                    stack.append(nb)
+        if len(comp) > 1:
+            regions.append(comp)
+    return regions
+
+
+# ============================================================
+# OBJ
+# ============================================================
+def _obj_corner(refs, n_vt: int, n_vn: int) -> str:
+    """Sufixo "/vt/vn" de um canto com índices absolutos ("" se não houver)."""
+    if not refs:
+        return ""
+    out = ""
+    for ref, total in zip(refs, (n_vt, n_vn)):
+        if ref:
+            i = int(ref)
+            ref = str(i if i > 0 else total + i + 1)
+        out += "/" + ref
+    return out
+
+
+def read_obj(path: Path) -> _Mesh:
+    """Lê a malha; linhas não interpretadas (o, g, s, l, comentários...) seguem literais na saída."""
+    mesh = _Mesh()
+    mesh.corners = []
+    n_vt = n_vn = 0
+    kinds = ("material", "group", "object")
+    for kind in kinds:
+        mesh.tags[kind] = array("i")
+        mesh.tag_names[kind] = []
+    ids = {kind: {} for kind in kinds}
+    current = {kind: -1 for kind in kinds}
+    data_started = False
+
+    def tag_id(kind, name):
+        table = ids[kind]
+        if name not in table:
+            table[name] = len(mesh.tag_names[kind])
+            mesh.tag_names[kind].append(name)
+        return table[name]
+
+    with open(path, "r", encoding="utf-8", errors="replace") as fh:
+        for line in fh:
+            line = line.rstrip("\n")
+            parts = line.split()
+            key = parts[0] if parts else ""
+            if key in ("v", "vt", "vn", "f"):
+                data_started = True
+            if key == "v":
+                mesh.co.extend((float(parts[1]), float(parts[2]), float(parts[3])))
+            elif key == "f":
+                nv = mesh.vert_count
+                face = []
+                corners = []
+                for tok in parts[1:]:
+                    refs = tok.split("/")
+                    i = int(refs[0])
+                    face.append(i - 1 if i > 0 else nv + i)
+                    corners.append(_obj_corner(refs[1:], n_vt, n_vn))
+                # mesmo critério de `_dedupe_cycle`, mantendo os cantos alinhados
+                keep = [k for k in range(len(face)) if face[k] != face[k - 1]]
+                face = [face[k] for k in keep]
+                if len(face) >= 3:
+                    mesh.stream.append(len(mesh.faces))
+                    mesh.faces.append(face)
+                    mesh.corners.append([corners[k] for k in keep] if any(corners) else None)
+                    for kind in kinds:
+                        mesh.tags[kind].append(current[kind])
+            elif key in ("vt", "vn"):
+                mesh.attr_lines.append(line)
+                if key == "vt":
+                    n_vt += 1
+                else:
+                    n_vn += 1
+            elif key in ("l", "p"):
+                # polilinhas/pontos referenciam vértices: índices absolutos, remapeados na saída
+                nv = mesh.vert_count
+                verts = []
+                corners = []
+                for tok in parts[1:]:
+                    refs = tok.split("/")
+                    i = int(refs[0])
+                    verts.append(i - 1 if i > 0 else nv + i)
+                    corners.append(_obj_corner(refs[1:], n_vt, n_vn))
+                mesh.keep_verts.update(verts)
+                mesh.stream.append((key, verts, corners))
+            else:
+                if key == "usemtl":
+                    current["material"] = tag_id("material", line.strip()[len(key):].strip())
+                elif key == "g":
+                    current["group"] = tag_id("group", line.strip())
+                elif key == "o":
+                    current["object"] = tag_id("object", line.strip())
+                    current["group"] = -1
+                (mesh.stream if data_started else mesh.header).append(line)
+    return mesh
+
+
+def write_obj(mesh: _Mesh, path: Path) -> None:
+    remap = _vertex_remap(mesh)
+    welded = mesh.welded
+
+    def out_index(v):
+        while v in welded:
+            v = welded[v]
+        return remap[v]
+
+    with open(path, "w", encoding="utf-8", buffering=CHUNK_SIZE) as out:
+        out.write("# Flat Surface Cleaner\n")
+        for line in mesh.header:
+            out.write(line + "\n")
+        co = mesh.co
+        for i in range(mesh.vert_count):
+            if remap[i] >= 0:
+                j = 3 * i
+                out.write(f"v {co[j]:.9g} {co[j + 1]:.9g} {co[j + 2]:.9g}\n")
+        for line in mesh.attr_lines:
+            out.write(line + "\n")
+        for item in mesh.stream:
+            if isinstance(item, str):
+                out.write(item + "\n")
+                continue
+            if isinstance(item, int):
+                f = mesh.faces[item]
+                if f is None:
+                    continue
+                corners = mesh.corners[item]
+                if corners is None:
+                    out.write("f " + " ".join(str(remap[v] + 1) for v in f) + "\n")
+                else:
+                    out.write("f " + " ".join(f"{remap[v] + 1}{c}" for v, c in zip(f, corners)) + "\n")
+                continue
+            key, verts, corners = item
+            refs = [f"{out_index(v) + 1}{c}" for v, c in zip(verts, corners) if out_index(v) >= 0]
+            if len(refs) >= (2 if key == "l" else 1):
+                out.write(f"{key} " + " ".join(refs) + "\n")
+
+
+def _vertex_remap(mesh: _Mesh):
+    remap = array("i", [-1]) * mesh.vert_count
+    n = 0
+    dead = mesh.dead
+    for i in range(mesh.vert_count):
+        if i not in dead:
+            remap[i] = n
+            n += 1
+    return remap
+
+
+# ============================================================
+# PLY binário (mmap + escrita em streaming)
+# ============================================================
+class _PlyElement:
+    def __init__(self, name, count):
+        self.name = name
+        self.count = count
+        self.props = []  # (nome, tipo) ou (nome, ("list", tipo_contagem, tipo_item))
+
+
+def _read_ply_header(mm):
+    end = mm.find(b"end_header")
+    if end < 0 or not mm[:3] == b"ply":
+        raise ValueError("Cabeçalho PLY inválido.")
+    body_start = mm.find(b"\n", end) + 1
+    lines = mm[:body_start].decode("ascii", errors="replace").splitlines()
+    fmt = None
+    elements = []
+    for line in lines:
+        parts = line.split()
+        if not parts:
+            continue
+        if parts[0] == "format":
+            fmt = parts[1]
+        elif parts[0] == "element":
+            elements.append(_PlyElement(parts[1], int(parts[2])))
+        elif parts[0] == "property":
+            if parts[1] == "list":
+                elements[-1].props.append((parts[4], ("list", PLY_TYPES[parts[2]], PLY_TYPES[parts[3]])))
+            else:
+                elements[-1].props.append((parts[2], PLY_TYPES[parts[1]]))
+    if fmt == "binary_little_endian":
+        order = "<"
+    elif fmt == "binary_big_endian":
+        order = ">"
+    else:
+        raise ValueError(f"Formato PLY não suportado: {fmt} (use PLY binário).")
+    names = [e.name for e in elements]
+    if names[:2] != ["vertex", "face"] or len(names) > 2:
+        raise ValueError(f"Elementos PLY não suportados: {names} (esperado: vertex, face).")
+    return order, elements, body_start, lines
+
+
+def read_ply(path: Path, tag_property=None) -> _Mesh:
+    """Mapeia o arquivo e lê a malha; arquivo e mmap ficam abertos para `write_ply`."""
+    fh = open(path, "rb")
+    mm = None
+    try:
+        mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return _parse_ply(fh, mm, tag_property)
+    except BaseException:
+        if mm is not None:
+            mm.close()
+        fh.close()
+        raise
+
+
+def _parse_ply(fh, mm, tag_property) -> _Mesh:
+    order, (vert_el, face_el), offset, header = _read_ply_header(mm)
+
+    if any(isinstance(t, tuple) for _n, t in vert_el.props):
+        raise ValueError("Vértices PLY com propriedades em lista não são suportados.")
+    vfmt = order + "".join(t for _n, t in vert_el.props)
+    vsize = struct.calcsize(vfmt)
+    vnames = [n for n, _t in vert_el.props]
+    ix, iy, iz = vnames.index("x"), vnames.index("y"), vnames.index("z")
+
+    mesh = _Mesh()
+    vend = offset + vsize * vert_el.count
+    for rec in struct.iter_unpack(vfmt, memoryview(mm)[offset:vend]):
+        mesh.co.extend((rec[ix], rec[iy], rec[iz]))
+
+    # faces: lista de índices + propriedades escalares extras (preservadas na saída)
+    list_prop = None
+    scalar = []
+    for i, (name, t) in enumerate(face_el.props):
+        if isinstance(t, tuple) and name in ("vertex_indices", "vertex_index") and list_prop is None:
+            list_prop = i
+        elif isinstance(t, tuple):
+            raise ValueError(f"Propriedade de face em lista não suportada: {name}")
+        else:
+            scalar.append((i, name, t))
+    if list_prop is None:
+        raise ValueError("Faces PLY sem 'vertex_indices'.")
+    list_name, (_l, count_t, index_t) = face_el.props[list_prop]
+    count_s = struct.Struct(order + count_t)
+
+    if tag_property is None:
+        tag_property = next((n for n in PLY_TAG_CANDIDATES if any(s[1] == n for s in scalar)), None)
+    tag_slot = next((k for k, s in enumerate(scalar) if s[1] == tag_property), None)
+    if tag_property is not None and tag_slot is None:
+        raise ValueError(f"Propriedade de face PLY não encontrada: {tag_property!r}")
+
+    extras = []
+    tags = array("i")
+    pos = vend
+    item_size = struct.calcsize(order + index_t)
+    for _ in range(face_el.count):
+        values = []
+        face = None
+        for i, (name, t) in enumerate(face_el.props):
+            if i == list_prop:
+                (n,) = count_s.unpack_from(mm, pos)
+                pos += count_s.size
+                face = list(struct.unpack_from(f"{order}{n}{index_t}", mm, pos))
+                pos += n * item_size
+            else:
+                s = struct.Struct(order + t)
+                values.append(s.unpack_from(mm, pos)[0])
+                pos += s.size
+        mesh.faces.append(_dedupe_cycle(face))
+        extras.append(tuple(values) if values else None)
+        tags.append(int(values[tag_slot]) if tag_slot is not None else -1)
+
+    mesh.tags["ply"] = tags
+    mesh.ply = {
+        "file": fh,
+        "mmap": mm,
+        "order": order,
+        "header": header,
+        "vert_offset": offset,
+        "vert_size": vsize,
+        "vert_xyz": (ix, iy, iz),
+        "vert_struct": struct.Struct(vfmt),
+        "count_type": count_t,
+        "list_name": list_name,
+        "list_slot": list_prop,
+        "index_fmt": index_t,
+        "scalar": scalar,
+        "tag_property": tag_property,
+        "extras": extras,
+    }
+    return mesh
+
+
+def write_ply(mesh: _Mesh, path: Path) -> None:
+    info = mesh.ply
+    mm = info["mmap"]
+    remap = _vertex_remap(mesh)
+    n_verts = sum(1 for r in remap if r >= 0)
+    n_faces = sum(1 for f in mesh.faces if f is not None)
+
+    # faces reconstruídas podem passar do limite do tipo de contagem (uchar: 255)
+    count_t = info["count_type"]
+    max_len = max((len(f) for f in mesh.faces if f is not None), default=0)
+    widen = max_len > PLY_COUNT_MAX.get(count_t, 0)
+    if widen:
+        count_t = "I"
+
+    header = []
+    element = None
+    list_name = info["list_name"]
+    for line in info["header"]:
+        parts = line.split()
+        if parts[:1] == ["element"]:
+            element = parts[1]
+        if parts[:2] == ["element", "vertex"]:
+            line = f"element vertex {n_verts}"
+        elif parts[:2] == ["element", "face"]:
+            line = f"element face {n_faces}"
+        elif widen and element == "face" and parts[:2] == ["property", "list"] and parts[4] == list_name:
+            line = f"property list uint {parts[3]} {parts[4]}"
+        header.append(line)
+
+    vs = info["vert_struct"]
+    vsize = info["vert_size"]
+    voff = info["vert_offset"]
+    ix, iy, iz = info["vert_xyz"]
+    order = info["order"]
+    count_s = struct.Struct(order + count_t)
+    # registro de face na ordem do cabeçalho (None = lista de índices)
+    layout = [struct.Struct(order + t) for _i, _n, t in info["scalar"]]
+    layout.insert(info["list_slot"], None)
+    index_fmt = info["index_fmt"]
+    extras = info["extras"]
+    moved = mesh.moved
+
+    with open(path, "wb") as out:
+        out.write(("\n".join(header) + "\n").encode("ascii"))
+        buf = bytearray()
+        for i in range(mesh.vert_count):
+            if remap[i] < 0:
+                continue
+            start = voff + i * vsize
+            if i in moved:
+                rec = list(vs.unpack_from(mm, start))
+                rec[ix], rec[iy], rec[iz] = mesh.vert(i)
+                buf += vs.pack(*rec)
+            else:
+                buf += mm[start:start + vsize]
+            if len(buf) >= CHUNK_SIZE:
+                out.write(buf)
+                buf.clear()
+        for fi, f in enumerate(mesh.faces):
+            if f is None:
+                continue
+            values = iter(extras[fi] or ())
+            for s in layout:
+                if s is None:
+                    buf += count_s.pack(len(f))
+                    buf += struct.pack(f"{order}{len(f)}{index_fmt}", *(remap[v] for v in f))
+                else:
+                    buf += s.pack(next(values))
+            if len(buf) >= CHUNK_SIZE:
+                out.write(buf)
+                buf.clear()
+        out.write(buf)
+
+
+def _close(mesh: _Mesh) -> None:
+    info = mesh.ply
+    if info:
+        info["mmap"].close()
+        info["file"].close()
+
+
+# ============================================================
+# Arquivo -> arquivo
+# ============================================================
+def process_file(src, dst, args) -> dict:
+    """Limpa um arquivo e grava o resultado; retorna estatísticas."""
+    src, dst = Path(src), Path(dst)
+    is_ply = src.suffix.lower() == ".ply"
+    mesh = read_ply(src, args.tag_property) if is_ply else read_obj(src)
+    stats = _new_stats(src, dst)
+    try:
+        mesh.build_adjacency()
+        # com weld, vértices duplicados nas costuras também conectam as faces
+        merge_distance = 0.0 if args.no_weld else args.merge_distance
+        if args.regions == "tags":
+            if is_ply and mesh.ply["tag_property"] is None:
+                raise ValueError("Nenhuma propriedade de tag nas faces PLY (procuradas: "
+                                 f"{', '.join(PLY_TAG_CANDIDATES)}); use --tag-property.")
+            tags = mesh.tags["ply"] if is_ply else mesh.tags[args.tag]
+            regions = tagged_regions(mesh, tags, merge_distance)
+        else:
+            plane_tol = args.plane_tol
+            if plane_tol is None:
+                plane_tol = 1e-4 * mesh.bbox_diagonal()
+            regions = coplanar_regions(mesh, args.angle, plane_tol, merge_distance)
+
+        opts = CleanOptions(
+            plane_mode=args.plane_mode,
+            remove_doubles=not args.no_weld,
+            merge_distance=args.merge_distance,
+            simplify_boundary=args.simplify,
+            simplify_angle=args.simplify_angle,
+            keep_largest_loop=not args.all_loops,
+        )
+        stats["regions"] = len(regions)
+        for region in regions:
+            reason = clean_region(mesh, region, opts, stats)
+            if reason is None:
+                stats["ok"] += 1
+            else:
+                stats["failed"][reason] = stats["failed"].get(reason, 0) + 1
+
+        # grava num temporário ao lado do destino: o destino pode ser a própria
+        # entrada, ainda mapeada em memória (--suffix "")
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dst.with_name(f".{dst.name}.fsc-tmp")
+        try:
+            if is_ply:
+                write_ply(mesh, tmp)
+            else:
+                write_obj(mesh, tmp)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+    finally:
+        _close(mesh)
+    os.replace(tmp, dst)
+    return stats
+
+
+def _new_stats(src, dst) -> dict:
+    return {"src": str(src), "dst": str(dst), "error": None, "regions": 0, "ok": 0, "failed": {},
+            "welded": 0, "dissolved": 0, "faces_removed": 0}
+
+
+def _output_path(src: Path, out_dir, suffix: str) -> Path:
+    name = f"{src.stem}{suffix}{src.suffix}"
+    return (Path(out_dir) if out_dir else src.parent) / name
+
+
+def _job(job):
+    src, dst, args = job
+    try:
+        return process_file(src, dst, args)
+    except Exception as exc:
+        # um arquivo ruim não interrompe o lote: vira falha nas estatísticas
+        stats = _new_stats(src, dst)
+        stats["error"] = f"{type(exc).__name__}: {exc}"
+        return stats
+
+
+def _parse_args(argv=None):
+    p = argparse.ArgumentParser(description="Limpeza de superfícies planas em OBJ/PLY (sem Blender).")
+    p.add_argument("inputs", nargs="+", help="arquivos .obj ou .ply (binário)")
+    p.add_argument("-o", "--output-dir", help="pasta de saída (padrão: ao lado da entrada)")
+    p.add_argument("--suffix", default="_clean", help="sufixo do arquivo de saída (padrão: _clean)")
+    p.add_argument("-j", "--jobs", type=int, default=1, help="processos em paralelo (um arquivo por processo)")
+    p.add_argument("--regions", choices=("coplanar", "tags"), default="coplanar",
+                   help="varredura coplanar ou tags do arquivo")
+    p.add_argument("--angle", type=float, default=1.0,
+                   help="coplanar: desvio máximo entre normais, em graus (padrão: 1.0)")
+    p.add_argument("--plane-tol", type=float, default=None,
+                   help="coplanar: distância máxima ao plano da semente (padrão: 1e-4 x diagonal)")
+    p.add_argument("--tag", choices=("material", "group", "object"), default="material",
+                   help="OBJ: tag usada em --regions tags")
+    p.add_argument("--tag-property", default=None,
+                   help="PLY: propriedade inteira de face usada em --regions tags "
+                        f"(padrão: a primeira entre {', '.join(PLY_TAG_CANDIDATES)})")
+    p.add_argument("--plane-mode", choices=("BEST_FIT", "AVERAGE"), default="BEST_FIT")
+    p.add_argument("--merge-distance", type=float, default=0.0001)
+    p.add_argument("--no-weld", action="store_true", help="não mescla vértices próximos no contorno")
+    p.add_argument("--simplify", action="store_true", help="dissolve vértices colineares no contorno")
+    p.add_argument("--simplify-angle", type=float, default=0.2, help="tolerância da simplificação, em graus")
+    p.add_argument("--all-loops", action="store_true",
+                   help="não descarta contornos menores (padrão: mantém só o de maior área)")
+    return p.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    jobs = []
+    for name in args.inputs:
+        src = Path(name)
+        if src.suffix.lower() not in (".obj", ".ply"):
+            print(f"Ignorado (extensão não suportada): {src}", file=sys.stderr)
+            continue
+        jobs.append((src, _output_path(src, args.output_dir, args.suffix), args))
+
+    if args.jobs > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as ex:
+            results = list(ex.map(_job, jobs))
+    else:
+        results = [_job(j) for j in jobs]
+
+    status = 0
+    for st in results:
+        if st["error"]:
+            status = 1
+            print(f"{st['src']}: erro: {st['error']}", file=sys.stderr)
+            continue
+        msg = f"{st['src']} -> {st['dst']}: {st['ok']}/{st['regions']} regiões reconstruídas"
+        msg += f" (weld {st['welded']}, dissolve {st['dissolved']}, faces removidas {st['faces_removed']})"
+        if st["failed"]:
+            status = 1
+            msg += "; falhas: " + ", ".join(f"{k}={v}" for k, v in sorted(st["failed"].items()))
+        print(msg)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,47 +2,154 @@
 """Gera o pacote instalável do addon como arquivo zip.
 
 Uso:
-    python make_zip.py
+    python make_zip.py [--blender CAMINHO]
 
-Cria `flat-surface-cleaner.zip` contendo a pasta `flat_surface_cleaner` com
-`__init__.py` (copiado de `dissolve.py`).
+Cria `flat-surface-cleaner.zip` contendo a pasta `flat_surface_cleaner`
+(pacote multi-módulo) e relata o impacto no startup: quais módulos são
+importados no registro e quais ficam para a primeira execução do operador.
+Se o Blender estiver disponível (`--blender`, `$BLENDER` ou no PATH), mede
+também o tempo real de `import` + `register()` em modo background.
 """
 
 from __future__ import annotations
 
+import argparse
+import ast
+import json
+import os
 import shutil
+import subprocess
 import tempfile
 import zipfile
 from pathlib import Path
 
 ROOT = Path(__file__).parent
-SRC = ROOT / "dissolve.py"
 PACKAGE_NAME = "flat_surface_cleaner"
+SRC = ROOT / PACKAGE_NAME
 ZIP_NAME = ROOT / "flat-surface-cleaner.zip"
 
+# Script executado dentro do Blender para medir o registro
+_MEASURE_SCRIPT = """
+import json, sys, time
+sys.path.insert(0, {path!r})
+numpy_before = "numpy" in sys.modules
+t0 = time.perf_counter()
+import {name}
+{name}.register()
+t1 = time.perf_counter()
+{name}.unregister()
+print("FSC_STARTUP " + json.dumps({{
+    "ms": (t1 - t0) * 1000.0,
+    "modules": sorted(m for m in sys.modules if m.split(".")[0] == {name!r}),
+    "numpy": "numpy" in sys.modules and not numpy_before,
+}}))
+"""
+
+
+def _package_files():
+    return sorted(p for p in SRC.rglob("*") if p.is_file() and "__pycache__" not in p.parts and p.suffix != ".pyc")
+
 
 def build_zip() -> Path:
-    if not SRC.exists():
-        raise FileNotFoundError(f"Código-fonte não encontrado: {SRC}")
+    if not (SRC / "__init__.py").exists():
+        raise FileNotFoundError(f"Pacote não encontrado: {SRC}")
+
+    with zipfile.ZipFile(ZIP_NAME, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for path in _package_files():
+            zf.write(path, path.relative_to(ROOT))
+
+    return ZIP_NAME
+
+
+def startup_modules() -> set[str]:
+    """Módulos do pacote importados no registro (imports relativos de nível de módulo)."""
+    pending = ["__init__"]
+    found = set()
+    while pending:
+        name = pending.pop()
+        if name in found:
+            continue
+        found.add(name)
+        tree = ast.parse((SRC / f"{name}.py").read_text(encoding="utf-8"))
+        for node in tree.body:
+            if not isinstance(node, ast.ImportFrom) or node.level != 1:
+                continue
+            if node.module:
+                pending.append(node.module.split(".")[0])
+            else:
+                pending.extend(alias.name for alias in node.names)
+    return found
 
+
+def _size(names) -> tuple[int, int]:
+    total_bytes = total_lines = 0
+    for name in names:
+        text = (SRC / f"{name}.py").read_text(encoding="utf-8")
+        total_bytes += len(text.encode("utf-8"))
+        total_lines += text.count("\n")
+    return total_bytes, total_lines
+
+
+def _find_blender(explicit: str | None) -> str | None:
+    return explicit or os.environ.get("BLENDER") or shutil.which("blender")
+
+
+def measure_in_blender(zip_path: Path, blender: str) -> dict | None:
+    """Extrai o zip e mede import + register() num Blender em background."""
     with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_path = Path(tmpdir)
-        package_root = tmp_path / PACKAGE_NAME
-        package_root.mkdir(parents=True, exist_ok=True)
+        with zipfile.ZipFile(zip_path) as zf:
+            zf.extractall(tmpdir)
+        script = _MEASURE_SCRIPT.format(path=tmpdir, name=PACKAGE_NAME)
+        try:
+            proc = subprocess.run(
+                [blender, "-b", "--factory-startup", "--python-expr", script],
+                capture_output=True, text=True, timeout=300,
+            )
+        except (OSError, subprocess.TimeoutExpired) as exc:
+            print(f"Falha ao executar o Blender ({blender}): {exc}")
+            return None
+    for line in proc.stdout.splitlines():
+        if line.startswith("FSC_STARTUP "):
+            return json.loads(line[len("FSC_STARTUP "):])
+    print(f"Medição no Blender não retornou resultado (código {proc.returncode}).")
+    return None
 
-        shutil.copy(SRC, package_root / "__init__.py")
 
-        with zipfile.ZipFile(ZIP_NAME, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-            for path in package_root.rglob("*"):
-                arcname = path.relative_to(tmp_path)
-                zf.write(path, arcname)
+def report_startup(zip_path: Path, blender: str | None) -> None:
+    all_modules = {p.stem for p in SRC.glob("*.py")}
+    eager = startup_modules()
+    lazy = all_modules - eager
+    eager_bytes, eager_lines = _size(eager)
+    lazy_bytes, lazy_lines = _size(lazy)
 
-    return ZIP_NAME
+    print("Impacto no startup:")
+    print(f"  no registro:   {', '.join(sorted(eager))} ({eager_lines} linhas, {eager_bytes / 1024:.1f} KiB)")
+    print(f"  sob demanda:   {', '.join(sorted(lazy)) or '-'} ({lazy_lines} linhas, {lazy_bytes / 1024:.1f} KiB)")
+
+    if not blender:
+        print("  Blender não encontrado (use --blender ou $BLENDER); tempo de registro não medido.")
+        return
+    result = measure_in_blender(zip_path, blender)
+    if result is None:
+        return
+    loaded = [m.split(".", 1)[1] for m in result["modules"] if "." in m]
+    unexpected = sorted(set(loaded) & lazy)
+    print(f"  import + register(): {result['ms']:.1f} ms")
+    print(f"  módulos carregados: {', '.join(loaded) or '-'}")
+    if unexpected:
+        print(f"  AVISO: módulos pesados carregados no registro: {', '.join(unexpected)}")
+    if result["numpy"]:
+        print("  AVISO: NumPy foi importado no registro.")
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Gera o zip instalável do add-on.")
+    parser.add_argument("--blender", help="executável do Blender para medir o tempo de registro")
+    args = parser.parse_args()
+
     zip_path = build_zip()
     print(f"Arquivo gerado: {zip_path}")
+    report_startup(zip_path, _find_blender(args.blender))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,334 @@
+"""Testes do `fsc_cli.py` (só biblioteca padrão; não precisam do Blender)."""
+
+import struct
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import fsc_cli  # noqa: E402
+
+PLY_FMT = {"uchar": "B", "int": "i", "uint": "I", "float": "f"}
+
+
+# ============================================================
+# Geração e leitura de arquivos de teste
+# ============================================================
+def grid(n, size=1.0):
+    """Grade plana n x n de quads em z=0: (vértices, faces)."""
+    verts = [(size * i / n, size * j / n, 0.0) for j in range(n + 1) for i in range(n + 1)]
+    faces = []
+    for j in range(n):
+        for i in range(n):
+            a = j * (n + 1) + i
+            faces.append([a, a + 1, a + n + 2, a + n + 1])
+    return verts, faces
+
+
+def write_ply(path, verts, faces, *, order="<", count_type="uchar", face_scalars=(), scalars_first=False):
+    """PLY binário; `face_scalars` = [(nome, tipo, valores)] antes ou depois da lista."""
+    fmt = "binary_little_endian" if order == "<" else "binary_big_endian"
+    scalar_lines = [f"property {t} {name}" for name, t, _values in face_scalars]
+    list_line = f"property list {count_type} int vertex_indices"
+    face_lines = scalar_lines + [list_line] if scalars_first else [list_line] + scalar_lines
+    header = [
+        "ply", f"format {fmt} 1.0",
+        f"element vertex {len(verts)}", "property float x", "property float y", "property float z",
+        f"element face {len(faces)}", *face_lines, "end_header",
+    ]
+    with open(path, "wb") as out:
+        out.write(("\n".join(header) + "\n").encode("ascii"))
+        for v in verts:
+            out.write(struct.pack(order + "3f", *v))
+        for fi, f in enumerate(faces):
+            scalars = b"".join(struct.pack(order + PLY_FMT[t], values[fi]) for _n, t, values in face_scalars)
+            indices = struct.pack(f"{order}{PLY_FMT[count_type]}{len(f)}i", len(f), *f)
+            out.write(scalars + indices if scalars_first else indices + scalars)
+
+
+def read_ply(path):
+    """Leitor independente: (linhas do cabeçalho, vértices, faces, {propriedade escalar: valores})."""
+    data = Path(path).read_bytes()
+    end = data.index(b"end_header\n") + len(b"end_header\n")
+    header = data[:end].decode("ascii").splitlines()
+    order = "<" if "binary_little_endian" in header[1] else ">"
+    elements = []
+    for line in header:
+        parts = line.split()
+        if parts[0] == "element":
+            elements.append((parts[1], int(parts[2]), []))
+        elif parts[0] == "property":
+            elements[-1][2].append(parts[1:])
+    pos = end
+    verts, faces, scalars = [], [], {}
+    for name, count, props in elements:
+        for _ in range(count):
+            rec = {}
+            for prop in props:
+                if prop[0] == "list":
+                    cf, itf = order + PLY_FMT[prop[1]], PLY_FMT[prop[2]]
+                    (n,) = struct.unpack_from(cf, data, pos)
+                    pos += struct.calcsize(cf)
+                    rec[prop[3]] = list(struct.unpack_from(f"{order}{n}{itf}", data, pos))
+                    pos += n * struct.calcsize(itf)
+                else:
+                    f = order + PLY_FMT[prop[0]]
+                    (rec[prop[1]],) = struct.unpack_from(f, data, pos)
+                    pos += struct.calcsize(f)
+            if name == "vertex":
+                verts.append((rec["x"], rec["y"], rec["z"]))
+            else:
+                faces.append(rec.pop("vertex_indices"))
+                for k, v in rec.items():
+                    scalars.setdefault(k, []).append(v)
+    assert pos == len(data)
+    return header, verts, faces, scalars
+
+
+def cube():
+    """Cubo unitário de 6 quads: nenhuma região coplanar com mais de uma face."""
+    verts = [(x, y, z) for z in (0.0, 1.0) for y in (0.0, 1.0) for x in (0.0, 1.0)]
+    faces = [[0, 2, 3, 1], [4, 5, 7, 6], [0, 1, 5, 4], [2, 6, 7, 3], [0, 4, 6, 2], [1, 3, 7, 5]]
+    return verts, faces
+
+
+def run(tmp_path, *args):
+    out_dir = tmp_path / "out"
+    status = fsc_cli.main([*map(str, args), "-o", str(out_dir)])
+    return status, out_dir
+
+
+# ============================================================
+# PLY
+# ============================================================
+@pytest.mark.parametrize("order", ["<", ">"])
+def test_ply_round_trip_without_regions(tmp_path, order):
+    verts, faces = cube()
+    write_ply(tmp_path / "cube.ply", verts, faces, order=order)
+
+    status, out = run(tmp_path, tmp_path / "cube.ply")
+
+    assert status == 0
+    assert (out / "cube_clean.ply").read_bytes() == (tmp_path / "cube.ply").read_bytes()
+
+
+@pytest.mark.parametrize("order", ["<", ">"])
+def test_ply_grid_rebuilds_into_one_face(tmp_path, order):
+    verts, faces = grid(3)
+    write_ply(tmp_path / "grid.ply", verts, faces, order=order)
+
+    status, out = run(tmp_path, tmp_path / "grid.ply")
+
+    assert status == 0
+    header, out_verts, out_faces, _scalars = read_ply(out / "grid_clean.ply")
+    assert header[1].startswith("format binary_little_endian" if order == "<" else "format binary_big_endian")
+    assert len(out_faces) == 1 and len(out_faces[0]) == 12
+    assert len(out_verts) == 12
+    border = {(round(x, 5), round(y, 5)) for x, y, _z in verts if x in (0.0, 1.0) or y in (0.0, 1.0)}
+    assert {(round(x, 5), round(y, 5)) for x, y, _z in out_verts} == border
+
+
+def test_ply_face_over_255_verts_widens_count_type(tmp_path):
+    verts, faces = grid(70)
+    write_ply(tmp_path / "big.ply", verts, faces, count_type="uchar")
+
+    status, out = run(tmp_path, tmp_path / "big.ply")
+
+    assert status == 0
+    header, _verts, faces, _scalars = read_ply(out / "big_clean.ply")
+    assert "property list uint int vertex_indices" in header
+    assert [len(f) for f in faces] == [280]
+
+
+def test_ply_scalar_before_list_keeps_record_order(tmp_path):
+    verts, faces = grid(3)
+    material = [1] * 5 + [2] * 4
+    write_ply(tmp_path / "sf.ply", verts, faces,
+              face_scalars=[("material_index", "int", material)], scalars_first=True)
+
+    status, out = run(tmp_path, tmp_path / "sf.ply", "--regions", "tags")
+
+    assert status == 0
+    header, out_verts, out_faces, scalars = read_ply(out / "sf_clean.ply")
+    assert header.index("property int material_index") < header.index("property list uchar int vertex_indices")
+    assert all(0 <= v < len(out_verts) for f in out_faces for v in f)
+    assert sorted(scalars["material_index"]) == [1, 2]
+
+
+def test_ply_output_over_input_path(tmp_path):
+    verts, faces = grid(3)
+    write_ply(tmp_path / "g.ply", verts, faces)
+
+    status = fsc_cli.main([str(tmp_path / "g.ply"), "--suffix", ""])
+
+    assert status == 0
+    _header, _verts, out_faces, _scalars = read_ply(tmp_path / "g.ply")
+    assert [len(f) for f in out_faces] == [12]
+    assert [p.name for p in tmp_path.iterdir()] == ["g.ply"]
+
+
+def test_bad_input_is_reported_without_aborting_the_batch(tmp_path, capsys):
+    (tmp_path / "ascii.ply").write_text(
+        "ply\nformat ascii 1.0\nelement vertex 0\nelement face 0\nend_header\n", encoding="ascii")
+    verts, faces = grid(2)
+    write_ply(tmp_path / "good.ply", verts, faces)
+
+    status, out = run(tmp_path, tmp_path / "ascii.ply", tmp_path / "good.ply", "-j", "2")
+
+    assert status == 1
+    captured = capsys.readouterr()
+    assert "ascii.ply: erro: ValueError" in captured.err
+    assert "good.ply" in captured.out
+    assert (out / "good_clean.ply").exists()
+
+
+def test_ply_tag_property_selects_regions(tmp_path):
+    verts, faces = grid(2)
+    scalars = [("material_index", "int", [0, 0, 0, 0]), ("group", "int", [1, 1, 2, 2])]
+    write_ply(tmp_path / "tags.ply", verts, faces, face_scalars=scalars)
+
+    status, out = run(tmp_path, tmp_path / "tags.ply", "--regions", "tags", "--tag-property", "group")
+
+    assert status == 0
+    _header, _verts, out_faces, out_scalars = read_ply(out / "tags_clean.ply")
+    # uma região por grupo (material_index único seria uma região só)
+    assert len(out_faces) == 2
+    assert sorted(out_scalars["group"]) == [1, 2]
+    assert out_scalars["material_index"] == [0, 0]
+
+
+
+@pytest.mark.parametrize("extra", [[], ["--tag-property", "face_set"]])
+def test_ply_missing_tag_property_is_an_error(tmp_path, capsys, extra):
+    verts, faces = grid(2)
+    write_ply(tmp_path / "notag.ply", verts, faces, face_scalars=[("flags", "int", [0, 0, 0, 0])])
+
+    status, out = run(tmp_path, tmp_path / "notag.ply", "--regions", "tags", *extra)
+
+    assert status == 1
+    err = capsys.readouterr().err
+    assert "notag.ply: erro: ValueError" in err
+    assert ("face_set" in err) if extra else ("--tag-property" in err)
+    assert not out.exists()
+
+
+# ============================================================
+# OBJ
+# ============================================================
+def test_obj_round_trip_without_regions(tmp_path):
+    verts, faces = cube()
+    lines = ["# exportado", "mtllib cube.mtl"] + [f"v {x:g} {y:g} {z:g}" for x, y, z in verts]
+    lines += ["o Part", "g box", "s 1", "usemtl red"] + ["f " + " ".join(str(v + 1) for v in f) for f in faces[:3]]
+    lines += ["s off", "usemtl blue"] + ["f " + " ".join(str(v + 1) for v in f) for f in faces[3:]]
+    lines += ["l 4 5", "p 1"]
+    (tmp_path / "cube.obj").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    status, out = run(tmp_path, tmp_path / "cube.obj")
+
+    assert status == 0
+    text = (out / "cube_clean.obj").read_text(encoding="utf-8").splitlines()
+    assert text[0].startswith("#")
+    assert text[1:] == lines
+
+
+def test_obj_polyline_indices_follow_removed_vertices(tmp_path):
+    verts, faces = grid(2)
+    lines = [f"v {x} {y} {z}" for x, y, z in verts]
+    lines += ["o Plate", "s 1"] + ["f " + " ".join(str(v + 1) for v in f) for f in faces]
+    lines += ["l 1 9", "l -9 -1"]
+    (tmp_path / "pl.obj").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    status, out = run(tmp_path, tmp_path / "pl.obj")
+
+    assert status == 0
+    text = (out / "pl_clean.obj").read_text(encoding="utf-8").splitlines()
+    assert sum(line.startswith("v ") for line in text) == 8
+    assert text[text.index("o Plate") + 1] == "s 1"
+    # o vértice central (5) some: v9 vira 8
+    assert text[-2:] == ["l 1 8", "l 1 8"]
+
+
+def test_obj_keeps_uv_and_normals_on_untouched_faces(tmp_path):
+    verts, faces = grid(2)
+    lines = [f"v {x} {y} {z}" for x, y, z in verts] + ["v 0 0 1", "v 0.5 0 1"]
+    lines += [f"vt {x} {y}" for x, y, _z in verts] + ["vt 0 1", "vt 0.5 1"]
+    lines += ["vn 0 0 1", "vn 0 -1 0"]
+    lines += ["f " + " ".join(f"{v + 1}/{v + 1}/1" for v in f) for f in faces]
+    lines += ["f 1/1/2 2/2/2 -1/-1/-1 -2/-2/-1"]  # parede: índices relativos
+    (tmp_path / "uv.obj").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    status, out = run(tmp_path, tmp_path / "uv.obj")
+
+    assert status == 0
+    text = (out / "uv_clean.obj").read_text(encoding="utf-8").splitlines()
+    assert sum(line.startswith("vt ") for line in text) == 11
+    assert sum(line.startswith("vn ") for line in text) == 2
+    face_lines = [line for line in text if line.startswith("f ")]
+    # o vértice central some: v10/v11 viram 9/10, vt e vn seguem absolutos
+    assert "f 1/1/2 2/2/2 10/11/2 9/10/2" in face_lines
+    rebuilt = [line for line in face_lines if "/" not in line]
+    assert len(face_lines) == 2 and len(rebuilt) == 1
+    assert len(rebuilt[0].split()) == 1 + 8
+
+
+DUP_OBJ = """\
+v 0 0 0
+v 1 0 0
+v 1 1 0
+v 0 1 0
+v 1 0 0
+v 2 0 0
+v 2 1 0
+v 1 1 0
+v 1 0 1
+v 1 1 1
+vt 0 0
+vt 1 0
+vt 1 1
+vt 0 1
+usemtl a
+f 1 2 3 4
+f 5 6 7 8
+usemtl b
+f 5/1 8/2 10/3 9/4
+"""
+
+
+def _check_welded_dup(out_path):
+    text = out_path.read_text(encoding="utf-8").splitlines()
+    assert sum(line.startswith("v ") for line in text) == 8
+    face_lines = [line for line in text if line.startswith("f ")]
+    # os dois quads (costura com vértices duplicados) viram uma face de 6 vértices
+    assert sorted(len(line.split()) - 1 for line in face_lines) == [4, 6]
+    # a parede usava os duplicados: passa aos representantes e mantém os vt
+    assert "f 2/1 3/2 8/3 7/4" in face_lines
+
+
+def test_coplanar_regions_connect_through_duplicated_vertices(tmp_path):
+    (tmp_path / "dup.obj").write_text(DUP_OBJ, encoding="utf-8")
+
+    status, out = run(tmp_path, tmp_path / "dup.obj")
+
+    assert status == 0
+    _check_welded_dup(out / "dup_clean.obj")
+
+
+def test_tag_regions_connect_through_duplicated_vertices(tmp_path):
+    (tmp_path / "dup.obj").write_text(DUP_OBJ, encoding="utf-8")
+
+    status, out = run(tmp_path, tmp_path / "dup.obj", "--regions", "tags")
+
+    assert status == 0
+    _check_welded_dup(out / "dup_clean.obj")
+
+
+def test_no_weld_keeps_index_connectivity(tmp_path):
+    (tmp_path / "dup.obj").write_text(DUP_OBJ, encoding="utf-8")
+
+    status, out = run(tmp_path, tmp_path / "dup.obj", "--no-weld")
+
+    assert status == 0
+    assert (out / "dup_clean.obj").read_text(encoding="utf-8").count("\nf ") == 3
@@ -0,0 +1,95 @@
+"""Testes de `flat_surface_cleaner/tolerance.py` (sem Blender: o módulo não usa bpy)."""
+
+import importlib.util
+import math
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# carregado pelo caminho: o __init__ do pacote importa bpy
+_spec = importlib.util.spec_from_file_location("fsc_tolerance", ROOT / "flat_surface_cleaner" / "tolerance.py")
+tolerance = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(tolerance)
+
+
+# ============================================================
+# Vetores e arestas mínimos (no lugar de mathutils/bmesh)
+# ============================================================
+class Vec:
+    def __init__(self, x, y, z=0.0):
+        self.xyz = (x, y, z)
+
+    def __sub__(self, other):
+        return Vec(*(a - b for a, b in zip(self.xyz, other.xyz)))
+
+    @property
+    def length(self):
+        return math.sqrt(sum(c * c for c in self.xyz))
+
+    def angle(self, other):
+        dot = sum(a * b for a, b in zip(self.xyz, other.xyz))
+        return math.acos(max(-1.0, min(1.0, dot / (self.length * other.length))))
+
+
+class Edge:
+    def __init__(self, a, b):
+        self.verts = (a, b)
+
+
+def loop_edges(points):
+    """Arestas de um contorno fechado; cada ponto é o próprio vértice."""
+    verts = [Vec(*p) for p in points]
+    return [Edge(verts[i], verts[(i + 1) % len(verts)]) for i in range(len(verts))]
+
+
+def estimate(points):
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    scale = math.hypot(max(xs) - min(xs), max(ys) - min(ys))
+    return tolerance.estimate_tolerances(loop_edges(points), lambda v: v, scale)
+
+
+def circle(n, radius=1.0):
+    return [(radius * math.cos(2 * math.pi * i / n), radius * math.sin(2 * math.pi * i / n)) for i in range(n)]
+
+
+# ============================================================
+# Weld
+# ============================================================
+def test_chamfers_are_not_welded():
+    c = 0.014 / math.sqrt(2.0)  # chanfro de 0.014 em cada canto de uma placa 1 x 1
+    points = [(c, 0), (1 - c, 0), (1, c), (1, 1 - c), (1 - c, 1), (c, 1), (0, 1 - c), (0, c)]
+    merge, _angle = estimate(points)
+    assert merge < 0.014 * 0.5
+
+
+def test_degenerate_duplicates_are_welded():
+    points = []
+    for x, y in [(0, 0), (1, 0), (1, 1), (0, 1)]:
+        points += [(x, y), (x + 1e-9, y)]  # duplicata de boolean/import em cada canto
+    merge, _angle = estimate(points)
+    assert 1e-9 < merge < 1e-3
+
+
+# ============================================================
+# Ângulo de simplificação
+# ============================================================
+@pytest.mark.parametrize("n", [256, 512, 1024, 2048])
+def test_tessellated_circle_is_kept(n):
+    _merge, angle = estimate(circle(n))
+    assert angle < 360.0 / n
+
+
+def test_noise_below_corners_is_dissolved():
+    points = []
+    for a, b in [((0, 0), (1, 0)), ((1, 0), (1, 1)), ((1, 1), (0, 1)), ((0, 1), (0, 0))]:
+        for i in range(20):
+            t = i / 20
+            wobble = 1e-5 * (-1) ** i if i else 0.0  # ruído de ~0.05° ao longo de cada lado
+            x = a[0] + (b[0] - a[0]) * t + wobble * (b[1] - a[1])
+            y = a[1] + (b[1] - a[1]) * t - wobble * (b[0] - a[0])
+            points.append((x, y))
+    _merge, angle = estimate(points)
+    assert 0.1 < angle < 45.0